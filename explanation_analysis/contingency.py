@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+"""
+Shared chi-square tests for stacks of contingency tables
+
+The hypothesis-driven and the rigorous pattern analyses both test many
+small condition tables at once; this module holds the one vectorized
+implementation they use.
+"""
+
+import numpy as np
+from scipy.special import chdtrc
+
+
+def chi_square_tests(contingency_tables):
+    """Chi-square test of independence for a stack of contingency tables.
+    
+    Returns (chi2, p_value, cramers_v) arrays with one entry per table. Matches
+    chi2_contingency for tables with more than one degree of freedom, where no
+    continuity correction applies; the p-value comes straight from the chi-square
+    survival function.
+    """
+    row_sums = contingency_tables.sum(axis=2, keepdims=True)
+    col_sums = contingency_tables.sum(axis=1, keepdims=True)
+    n = contingency_tables.sum(axis=(1, 2))
+    expected = row_sums * col_sums / n[:, None, None]
+    chi2_values = ((contingency_tables - expected) ** 2 / expected).sum(axis=(1, 2))
+    dof = (contingency_tables.shape[1] - 1) * (contingency_tables.shape[2] - 1)
+    p_values = chdtrc(dof, chi2_values)
+    
+    # Effect size (Cramér's V)
+    cramers_vs = np.sqrt(chi2_values / (n * (min(contingency_tables.shape[1:]) - 1)))
+    return chi2_values, p_values, cramers_vs
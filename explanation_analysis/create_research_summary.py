@@ -11,221 +11,250 @@ Date: September 2025
 
 import json
 import csv
+import heapq
+import numpy as np
 from pathlib import Path
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 
-def create_research_summary():
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# Result files below this size are cheaper to parse whole than to stream
+STREAM_MIN_BYTES = 1 << 20
+
+# Executive summary and key findings; rendered with str.format_map
+SUMMARY_TEMPLATE = """EXPLANATION ANALYSIS RESEARCH SUMMARY
+CHI 2025 Paper: Evaluation Framework Effects on Ethical Design Judgment
+======================================================================
+
+EXECUTIVE SUMMARY
+-----------------
+• Total explanations analyzed: {total}
+• Three experimental conditions: UEQ ({ueq_n}), UEEQ ({ueeq_n}), RAW ({raw_n})
+• Overall release decisions: {yes_n} Yes, {no_n} No
+• Average explanation length: {avg_length} characters
+
+KEY RESEARCH FINDINGS
+---------------------
+1. RELEASE RATE DIFFERENCES (Supporting H1: Framework Effects)
+   • RAW (no framework): {raw_rate:.1f}% release rate (highest)
+   • UEQ (standard): {ueq_rate:.1f}% release rate (moderate)
+   • UEEQ (ethics-enhanced): {ueeq_rate:.1f}% release rate (lowest)
+   • Effect size: {effect_size:.1f} percentage points (RAW vs UEEQ)
+
+2. EXPLANATION DEPTH AND ELABORATION
+   • RAW explanations: {raw_len:.1f} chars (most detailed)
+   • UEEQ explanations: {ueeq_len:.1f} chars (moderate detail)
+   • UEQ explanations: {ueq_len:.1f} chars (most concise)
+   • Suggests framework presence affects reasoning depth
+
+3. DATA-DRIVEN LANGUAGE PATTERNS
+   • UEQ: {ueq_score} mentions of 'score' (high reliance on metrics)
+   • UEEQ: {ueeq_score} mentions of 'score' (maintained metric focus)
+   • RAW: {raw_score} mentions of 'score' (no metric anchoring)
+   • Frameworks increase quantitative reasoning references
+
+4. ETHICAL REASONING PREVALENCE
+   • UEEQ: {ueeq_ethical} ethical mentions (enhanced framework effect)
+   • RAW: {raw_ethical} ethical mentions (baseline)
+   • UEQ: {ueq_ethical} ethical mentions (standard framework)
+   • Ethics-enhanced framework increases moral reasoning
+
+"""
+
+# Static closing sections of the research summary
+CLOSING_SECTIONS = """IMPLICATIONS FOR CHI 2025 PAPER
+--------------------------------
+1. MEASUREMENT AS INTERVENTION:
+   • Clear evidence that evaluation frameworks shape decisions
+   • Ethics-enhanced metrics reduce dark pattern acceptance
+   • Supports 'measurement as design intervention' hypothesis
+
+2. PROFESSIONAL DECISION-MAKING:
+   • UX professionals use available data to justify decisions
+   • Framework type affects reasoning depth and focus
+   • Demonstrates bounded rationality in design contexts
+
+3. METHODOLOGICAL CONTRIBUTION:
+   • Large-scale analysis of professional explanations (N=1313)
+   • Mixed-methods approach combining quantitative and qualitative
+   • Replicable text analysis methodology for UX research
+
+4. PRACTICAL IMPLICATIONS:
+   • Organizations can influence ethical decisions through metrics
+   • Standard UX frameworks may inadvertently promote problematic designs
+   • Need for ethics-aware evaluation methods in practice
+
+LIMITATIONS AND FUTURE WORK
+---------------------------
+• Cross-sectional design limits causal inference
+• Self-reported explanations may contain social desirability bias
+• Limited to text-based interfaces and dark patterns
+• Future work: longitudinal studies, behavioral observations
+
+DATA AND REPRODUCIBILITY
+------------------------
+• All analysis code and data processing scripts available
+• Explanation text analysis methodology fully documented
+• Word frequency and theme analysis results provided
+• Supports open science practices for replication
+"""
+
+def _load(path):
+    """Load a JSON analysis result, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(path.read_bytes())
+    with open(path, 'r') as f:
+        return json.load(f)
+
+def _load_top(path, k):
+    """Load the k (name, data) entries with the largest totals from a JSON object.
+    
+    Large files are streamed with ijson so only the current top k entries are
+    kept in memory; small files are parsed whole.
+    """
+    if IJSON_AVAILABLE and path.stat().st_size >= STREAM_MIN_BYTES:
+        with open(path, 'rb') as f:
+            return heapq.nlargest(k, ijson.kvitems(f, '', use_float=True), key=lambda item: item[1]['total'])
+    return _rank_by_total(_load(path))[:k]
+
+def _rank_by_total(results):
+    """Return (name, data) items ordered by descending total; ties keep file order."""
+    items = list(results.items())
+    totals = np.fromiter((data['total'] for _, data in items), dtype=np.int64, count=len(items))
+    return [items[i] for i in np.argsort(-totals, kind='stable')]
+
+def create_research_summary(output_dir, basic_stats, condition_comparison, theme_ranking, pattern_ranking):
     """Create a comprehensive research summary."""
-    output_dir = Path("explanation_analysis_output")
+    # Per-condition characteristics
+    ueq = condition_comparison['UEQ']['characteristics']
+    ueeq = condition_comparison['UEEQ']['characteristics']
+    raw = condition_comparison['RAW']['characteristics']
     
-    # Load analysis results
-    with open(output_dir / "analysis_summary.json", 'r') as f:
-        basic_stats = json.load(f)
+    by_condition = basic_stats['explanations_by_condition']
+    by_release = basic_stats['explanations_by_release']
     
-    with open(output_dir / "condition_comparison.json", 'r') as f:
-        condition_comparison = json.load(f)
+    # Values referenced by the summary template
+    ns = {
+        'total': basic_stats['total_explanations'],
+        'ueq_n': by_condition['UEQ'],
+        'ueeq_n': by_condition['UEEQ'],
+        'raw_n': by_condition['RAW'],
+        'yes_n': by_release['Yes'],
+        'no_n': by_release['No'],
+        'avg_length': basic_stats['average_explanation_length'],
+        'ueq_rate': ueq['yes_percentage'],
+        'ueeq_rate': ueeq['yes_percentage'],
+        'raw_rate': raw['yes_percentage'],
+        'effect_size': raw['yes_percentage'] - ueeq['yes_percentage'],
+        'ueq_len': ueq['average_length'],
+        'ueeq_len': ueeq['average_length'],
+        'raw_len': raw['average_length'],
+        'ueq_score': ueq['mentions_score'],
+        'ueeq_score': ueeq['mentions_score'],
+        'raw_score': raw['mentions_score'],
+        'ueq_ethical': ueq['mentions_ethical'],
+        'ueeq_ethical': ueeq['mentions_ethical'],
+        'raw_ethical': raw['mentions_ethical'],
+    }
     
-    with open(output_dir / "theme_analysis_detailed.json", 'r') as f:
-        theme_analysis = json.load(f)
+    # Create research summary
+    parts = [SUMMARY_TEMPLATE.format_map(ns)]
     
-    with open(output_dir / "decision_patterns.json", 'r') as f:
-        decision_patterns = json.load(f)
+    # Theme analysis insights
+    parts.append("5. QUALITATIVE THEME ANALYSIS\n")
     
-    # Create research summary
-    with open(output_dir / "RESEARCH_SUMMARY_CHI2025.txt", 'w') as f:
-        f.write("EXPLANATION ANALYSIS RESEARCH SUMMARY\n")
-        f.write("CHI 2025 Paper: Evaluation Framework Effects on Ethical Design Judgment\n")
-        f.write("=" * 70 + "\n\n")
-        
-        # Executive Summary
-        f.write("EXECUTIVE SUMMARY\n")
-        f.write("-" * 17 + "\n")
-        f.write(f"• Total explanations analyzed: {basic_stats['total_explanations']}\n")
-        f.write(f"• Three experimental conditions: UEQ ({basic_stats['explanations_by_condition']['UEQ']}), ")
-        f.write(f"UEEQ ({basic_stats['explanations_by_condition']['UEEQ']}), ")
-        f.write(f"RAW ({basic_stats['explanations_by_condition']['RAW']})\n")
-        f.write(f"• Overall release decisions: {basic_stats['explanations_by_release']['Yes']} Yes, ")
-        f.write(f"{basic_stats['explanations_by_release']['No']} No\n")
-        f.write(f"• Average explanation length: {basic_stats['average_explanation_length']} characters\n\n")
-        
-        # Key Findings
-        f.write("KEY RESEARCH FINDINGS\n")
-        f.write("-" * 21 + "\n")
-        
-        # Release rate differences
-        ueeq_rate = condition_comparison['UEQ']['characteristics']['yes_percentage']
-        ueeq_rate_formatted = condition_comparison['UEEQ']['characteristics']['yes_percentage']
-        raw_rate = condition_comparison['RAW']['characteristics']['yes_percentage']
-        
-        f.write(f"1. RELEASE RATE DIFFERENCES (Supporting H1: Framework Effects)\n")
-        f.write(f"   • RAW (no framework): {raw_rate:.1f}% release rate (highest)\n")
-        f.write(f"   • UEQ (standard): {ueeq_rate:.1f}% release rate (moderate)\n")
-        f.write(f"   • UEEQ (ethics-enhanced): {ueeq_rate_formatted:.1f}% release rate (lowest)\n")
-        f.write(f"   • Effect size: {raw_rate - ueeq_rate_formatted:.1f} percentage points (RAW vs UEEQ)\n\n")
-        
-        # Explanation length differences
-        ueeq_len = condition_comparison['UEQ']['characteristics']['average_length']
-        ueeq_len_formatted = condition_comparison['UEEQ']['characteristics']['average_length']
-        raw_len = condition_comparison['RAW']['characteristics']['average_length']
-        
-        f.write(f"2. EXPLANATION DEPTH AND ELABORATION\n")
-        f.write(f"   • RAW explanations: {raw_len:.1f} chars (most detailed)\n")
-        f.write(f"   • UEEQ explanations: {ueeq_len_formatted:.1f} chars (moderate detail)\n")
-        f.write(f"   • UEQ explanations: {ueeq_len:.1f} chars (most concise)\n")
-        f.write(f"   • Suggests framework presence affects reasoning depth\n\n")
-        
-        # Data-driven language
-        ueeq_score = condition_comparison['UEQ']['characteristics']['mentions_score']
-        ueeq_score_formatted = condition_comparison['UEEQ']['characteristics']['mentions_score']
-        raw_score = condition_comparison['RAW']['characteristics']['mentions_score']
-        
-        f.write(f"3. DATA-DRIVEN LANGUAGE PATTERNS\n")
-        f.write(f"   • UEQ: {ueeq_score} mentions of 'score' (high reliance on metrics)\n")
-        f.write(f"   • UEEQ: {ueeq_score_formatted} mentions of 'score' (maintained metric focus)\n")
-        f.write(f"   • RAW: {raw_score} mentions of 'score' (no metric anchoring)\n")
-        f.write(f"   • Frameworks increase quantitative reasoning references\n\n")
-        
-        # Ethical reasoning
-        ueeq_ethical = condition_comparison['UEQ']['characteristics']['mentions_ethical']
-        ueeq_ethical_formatted = condition_comparison['UEEQ']['characteristics']['mentions_ethical']
-        raw_ethical = condition_comparison['RAW']['characteristics']['mentions_ethical']
-        
-        f.write(f"4. ETHICAL REASONING PREVALENCE\n")
-        f.write(f"   • UEEQ: {ueeq_ethical_formatted} ethical mentions (enhanced framework effect)\n")
-        f.write(f"   • RAW: {raw_ethical} ethical mentions (baseline)\n")
-        f.write(f"   • UEQ: {ueeq_ethical} ethical mentions (standard framework)\n")
-        f.write(f"   • Ethics-enhanced framework increases moral reasoning\n\n")
-        
-        # Theme analysis insights
-        f.write("5. QUALITATIVE THEME ANALYSIS\n")
-        
-        # Top themes by prevalence
-        theme_ranking = sorted(theme_analysis.items(), key=lambda x: x[1]['total'], reverse=True)[:5]
-        f.write("   Top Decision Themes:\n")
-        total_explanations = basic_stats['total_explanations']
-        for i, (theme, data) in enumerate(theme_ranking, 1):
-            percentage = (data['total'] / total_explanations) * 100
-            f.write(f"   {i}. {theme.replace('_', ' ').title()}: {percentage:.1f}% of explanations\n")
-        f.write("\n")
-        
-        # Decision patterns
-        pattern_ranking = sorted(decision_patterns.items(), key=lambda x: x[1]['total'], reverse=True)[:3]
-        f.write("   Top Decision-Making Patterns:\n")
-        for i, (pattern, data) in enumerate(pattern_ranking, 1):
-            percentage = (data['total'] / total_explanations) * 100
-            f.write(f"   {i}. {pattern.replace('_', ' ').title()}: {percentage:.1f}% of explanations\n")
-        f.write("\n")
-        
-        # Implications for CHI paper
-        f.write("IMPLICATIONS FOR CHI 2025 PAPER\n")
-        f.write("-" * 32 + "\n")
-        f.write("1. MEASUREMENT AS INTERVENTION:\n")
-        f.write("   • Clear evidence that evaluation frameworks shape decisions\n")
-        f.write("   • Ethics-enhanced metrics reduce dark pattern acceptance\n")
-        f.write("   • Supports 'measurement as design intervention' hypothesis\n\n")
-        
-        f.write("2. PROFESSIONAL DECISION-MAKING:\n")
-        f.write("   • UX professionals use available data to justify decisions\n")
-        f.write("   • Framework type affects reasoning depth and focus\n")
-        f.write("   • Demonstrates bounded rationality in design contexts\n\n")
-        
-        f.write("3. METHODOLOGICAL CONTRIBUTION:\n")
-        f.write("   • Large-scale analysis of professional explanations (N=1313)\n")
-        f.write("   • Mixed-methods approach combining quantitative and qualitative\n")
-        f.write("   • Replicable text analysis methodology for UX research\n\n")
-        
-        f.write("4. PRACTICAL IMPLICATIONS:\n")
-        f.write("   • Organizations can influence ethical decisions through metrics\n")
-        f.write("   • Standard UX frameworks may inadvertently promote problematic designs\n")
-        f.write("   • Need for ethics-aware evaluation methods in practice\n\n")
-        
-        # Limitations and future work
-        f.write("LIMITATIONS AND FUTURE WORK\n")
-        f.write("-" * 27 + "\n")
-        f.write("• Cross-sectional design limits causal inference\n")
-        f.write("• Self-reported explanations may contain social desirability bias\n")
-        f.write("• Limited to text-based interfaces and dark patterns\n")
-        f.write("• Future work: longitudinal studies, behavioral observations\n\n")
-        
-        # Data availability
-        f.write("DATA AND REPRODUCIBILITY\n")
-        f.write("-" * 24 + "\n")
-        f.write("• All analysis code and data processing scripts available\n")
-        f.write("• Explanation text analysis methodology fully documented\n")
-        f.write("• Word frequency and theme analysis results provided\n")
-        f.write("• Supports open science practices for replication\n")
-
-    print("✓ Research summary created: RESEARCH_SUMMARY_CHI2025.txt")
-
-def create_tables_for_paper():
-    """Create publication-ready tables."""
-    output_dir = Path("explanation_analysis_output")
+    # Top themes by prevalence
+    parts.append("   Top Decision Themes:\n")
+    total_explanations = basic_stats['total_explanations']
+    inv_pct = 100.0 / total_explanations
+    for i, (theme, data) in enumerate(theme_ranking, 1):
+        percentage = data['total'] * inv_pct
+        parts.append(f"   {i}. {theme.replace('_', ' ').title()}: {percentage:.1f}% of explanations\n")
+    parts.append("\n")
     
-    # Load data
-    with open(output_dir / "condition_comparison.json", 'r') as f:
-        condition_comparison = json.load(f)
+    # Decision patterns
+    parts.append("   Top Decision-Making Patterns:\n")
+    for i, (pattern, data) in enumerate(pattern_ranking, 1):
+        percentage = data['total'] * inv_pct
+        parts.append(f"   {i}. {pattern.replace('_', ' ').title()}: {percentage:.1f}% of explanations\n")
+    parts.append("\n")
     
-    # Create Table 1: Condition Comparison
-    with open(output_dir / "TABLE1_Condition_Comparison.csv", 'w', newline='') as f:
-        writer = csv.writer(f)
-        writer.writerow(['Metric', 'UEQ', 'UEEQ', 'RAW'])
-        
-        writer.writerow(['Total Explanations', 
-                        condition_comparison['UEQ']['characteristics']['total_explanations'],
-                        condition_comparison['UEEQ']['characteristics']['total_explanations'],
-                        condition_comparison['RAW']['characteristics']['total_explanations']])
-        
-        writer.writerow(['Release Rate (%)', 
-                        f"{condition_comparison['UEQ']['characteristics']['yes_percentage']:.1f}",
-                        f"{condition_comparison['UEEQ']['characteristics']['yes_percentage']:.1f}",
-                        f"{condition_comparison['RAW']['characteristics']['yes_percentage']:.1f}"])
-        
-        writer.writerow(['Avg. Explanation Length', 
-                        f"{condition_comparison['UEQ']['characteristics']['average_length']:.1f}",
-                        f"{condition_comparison['UEEQ']['characteristics']['average_length']:.1f}",
-                        f"{condition_comparison['RAW']['characteristics']['average_length']:.1f}"])
-        
-        writer.writerow(['Mentions: Score', 
-                        condition_comparison['UEQ']['characteristics']['mentions_score'],
-                        condition_comparison['UEEQ']['characteristics']['mentions_score'],
-                        condition_comparison['RAW']['characteristics']['mentions_score']])
-        
-        writer.writerow(['Mentions: Ethical', 
-                        condition_comparison['UEQ']['characteristics']['mentions_ethical'],
-                        condition_comparison['UEEQ']['characteristics']['mentions_ethical'],
-                        condition_comparison['RAW']['characteristics']['mentions_ethical']])
+    parts.append(CLOSING_SECTIONS)
     
-    # Create Table 2: Theme Analysis
-    with open(output_dir / "theme_analysis_detailed.json", 'r') as f:
-        theme_analysis = json.load(f)
+    (output_dir / "RESEARCH_SUMMARY_CHI2025.txt").write_text(''.join(parts))
+
+    print("✓ Research summary created: RESEARCH_SUMMARY_CHI2025.txt")
+
+def _write_table1(output_dir, condition_comparison):
+    """Create Table 1: Condition Comparison."""
+    # Per-condition characteristics
+    ueq = condition_comparison['UEQ']['characteristics']
+    ueeq = condition_comparison['UEEQ']['characteristics']
+    raw = condition_comparison['RAW']['characteristics']
     
-    with open(output_dir / "TABLE2_Theme_Analysis.csv", 'w', newline='') as f:
+    with open(output_dir / "TABLE1_Condition_Comparison.csv", 'w', newline='', buffering=1 << 20) as f:
         writer = csv.writer(f)
-        writer.writerow(['Theme', 'Total', 'UEQ', 'UEEQ', 'RAW', 'Release_Yes', 'Release_No'])
-        
-        theme_ranking = sorted(theme_analysis.items(), key=lambda x: x[1]['total'], reverse=True)[:10]
-        for theme, data in theme_ranking:
-            writer.writerow([
-                theme.replace('_', ' ').title(),
-                data['total'],
-                data['by_condition']['UEQ'],
-                data['by_condition']['UEEQ'],
-                data['by_condition']['RAW'],
-                data['by_release']['Yes'],
-                data['by_release']['No']
-            ])
-    
-    print("✓ Publication tables created:")
-    print("  - TABLE1_Condition_Comparison.csv")
-    print("  - TABLE2_Theme_Analysis.csv")
+        writer.writerows([
+            ('Metric', 'UEQ', 'UEEQ', 'RAW'),
+            ('Total Explanations', ueq['total_explanations'], ueeq['total_explanations'], raw['total_explanations']),
+            ('Release Rate (%)', f"{ueq['yes_percentage']:.1f}", f"{ueeq['yes_percentage']:.1f}", f"{raw['yes_percentage']:.1f}"),
+            ('Avg. Explanation Length', f"{ueq['average_length']:.1f}", f"{ueeq['average_length']:.1f}", f"{raw['average_length']:.1f}"),
+            ('Mentions: Score', ueq['mentions_score'], ueeq['mentions_score'], raw['mentions_score']),
+            ('Mentions: Ethical', ueq['mentions_ethical'], ueeq['mentions_ethical'], raw['mentions_ethical']),
+        ])
+
+def _write_table2(output_dir, theme_ranking):
+    """Create Table 2: Theme Analysis."""
+    rows = [['Theme', 'Total', 'UEQ', 'UEEQ', 'RAW', 'Release_Yes', 'Release_No']]
+    rows.extend([theme.replace('_', ' ').title(),
+                 data['total'],
+                 data['by_condition']['UEQ'],
+                 data['by_condition']['UEEQ'],
+                 data['by_condition']['RAW'],
+                 data['by_release']['Yes'],
+                 data['by_release']['No']]
+                for theme, data in theme_ranking)
+    with open(output_dir / "TABLE2_Theme_Analysis.csv", 'w', newline='', buffering=1 << 20) as f:
+        csv.writer(f).writerows(rows)
 
 def main():
     """Main function."""
     print("Creating Research Summary for CHI 2025")
     print("=" * 40)
     
-    create_research_summary()
-    create_tables_for_paper()
+    output_dir = Path("explanation_analysis_output")
+    
+    # Load analysis results and rank themes/patterns once for both outputs
+    basic_stats = _load(output_dir / "analysis_summary.json")
+    condition_comparison = _load(output_dir / "condition_comparison.json")
+    theme_sorted = _load_top(output_dir / "theme_analysis_detailed.json", 10)
+    pattern_sorted = _load_top(output_dir / "decision_patterns.json", 3)
+    
+    # The summary and the two tables are independent files; write them concurrently
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        futures = [
+            executor.submit(create_research_summary, output_dir, basic_stats, condition_comparison,
+                            theme_sorted[:5], pattern_sorted[:3]),
+            executor.submit(_write_table1, output_dir, condition_comparison),
+            executor.submit(_write_table2, output_dir, theme_sorted[:10]),
+        ]
+        for future in futures:
+            future.result()
+    
+    print("✓ Publication tables created:")
+    print("  - TABLE1_Condition_Comparison.csv")
+    print("  - TABLE2_Theme_Analysis.csv")
     
     print("\n✓ Research summary generation complete!")
 
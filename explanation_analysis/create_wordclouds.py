@@ -7,12 +7,13 @@ This script creates word clouds for different conditions and decisions
 to visually represent the most prominent terms in explanations.
 """
 
-import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 from pathlib import Path
 from wordcloud import WordCloud
+from wordcloud.tokenization import unigrams_and_bigrams
 import json
+from data_loader import load_explanations
 
 class WordCloudGenerator:
     def __init__(self, data_dir="explanation_analysis_output"):
@@ -21,9 +22,8 @@ class WordCloudGenerator:
         self.explanations_df = None
         
     def load_data(self):
-        """Load the explanation data."""
-        csv_file = self.data_dir / "all_explanations_raw.csv"
-        self.explanations_df = pd.read_csv(csv_file)
+        """Load the explanation data (shared with the other analysis scripts)."""
+        self.explanations_df = load_explanations(self.data_dir)
         return self.explanations_df
     
     def create_word_clouds(self):
@@ -39,42 +39,58 @@ class WordCloudGenerator:
             'way', 'thing', 'things', 'time', 'feel', 'feeling', 'people', 'person'
         }
         
+        # Word frequencies per group, counted from the cached token lists
+        frequencies = {'overall': self._word_frequencies(self.explanations_df, custom_stopwords)}
+        for condition in ['UEQ', 'UEEQ', 'RAW']:
+            condition_data = self.explanations_df[self.explanations_df['condition'] == condition]
+            frequencies[condition] = self._word_frequencies(condition_data, custom_stopwords)
+        for decision in ['Yes', 'No']:
+            decision_data = self.explanations_df[self.explanations_df['release_decision'] == decision]
+            frequencies[decision] = self._word_frequencies(decision_data, custom_stopwords)
+        
         # 1. Overall word cloud
-        all_text = ' '.join(self.explanations_df['explanation'].astype(str))
-        self._create_single_wordcloud(all_text, "Overall Explanations", 
-                                    "wordcloud_overall.png", custom_stopwords)
+        self._create_single_wordcloud(frequencies['overall'], "Overall Explanations", 
+                                    "wordcloud_overall.png")
         
         # 2. By condition
         for condition in ['UEQ', 'UEEQ', 'RAW']:
-            condition_data = self.explanations_df[self.explanations_df['condition'] == condition]
-            condition_text = ' '.join(condition_data['explanation'].astype(str))
-            self._create_single_wordcloud(condition_text, f"{condition} Condition", 
-                                        f"wordcloud_{condition.lower()}.png", custom_stopwords)
+            self._create_single_wordcloud(frequencies[condition], f"{condition} Condition", 
+                                        f"wordcloud_{condition.lower()}.png")
         
         # 3. By release decision
         for decision in ['Yes', 'No']:
-            decision_data = self.explanations_df[self.explanations_df['release_decision'] == decision]
-            decision_text = ' '.join(decision_data['explanation'].astype(str))
             decision_label = "Accept" if decision == 'Yes' else "Reject"
-            self._create_single_wordcloud(decision_text, f"Release {decision_label}", 
-                                        f"wordcloud_release_{decision.lower()}.png", custom_stopwords)
+            self._create_single_wordcloud(frequencies[decision], f"Release {decision_label}", 
+                                        f"wordcloud_release_{decision.lower()}.png")
         
         # 4. Combined comparison figure
-        self._create_comparison_wordclouds(custom_stopwords)
+        self._create_comparison_wordclouds(frequencies)
         
         print("✓ Word clouds created")
     
-    def _create_single_wordcloud(self, text, title, filename, stopwords):
+    def _word_frequencies(self, data, stopwords):
+        """Count words the way WordCloud processes text, without joining the texts.
+        
+        As in WordCloud.process_text, a trailing 's is stripped and numbers are
+        dropped, then unigrams_and_bigrams removes stopwords, merges plurals, keeps
+        each word's most common casing and adds the default collocations. The token
+        lists are chained in row order, so bigrams span neighbouring explanations
+        as they did in the joined text.
+        """
+        words = (word[:-2] if word.lower().endswith("'s") else word for tokens in data['tokens'] for word in tokens)
+        words = [word for word in words if not word.isdigit()]
+        return unigrams_and_bigrams(words, stopwords, normalize_plurals=True, collocation_threshold=30)
+    
+    def _create_single_wordcloud(self, frequencies, title, filename):
         """Create a single word cloud."""
         wordcloud = WordCloud(
             width=800, 
             height=400, 
             background_color='white',
-            stopwords=stopwords,
             max_words=100,
             relative_scaling=0.5,
             colormap='viridis'
-        ).generate(text)
+        ).generate_from_frequencies(frequencies)
         
         plt.figure(figsize=(10, 5))
         plt.imshow(wordcloud, interpolation='bilinear')
@@ -84,23 +100,19 @@ class WordCloudGenerator:
         plt.savefig(self.output_dir / filename, dpi=300, bbox_inches='tight')
         plt.close()
     
-    def _create_comparison_wordclouds(self, stopwords):
+    def _create_comparison_wordclouds(self, frequencies):
         """Create a comparison figure with multiple word clouds."""
         fig, axes = plt.subplots(2, 3, figsize=(18, 12))
         
         # Row 1: Conditions
         conditions = ['UEQ', 'UEEQ', 'RAW']
         for i, condition in enumerate(conditions):
-            condition_data = self.explanations_df[self.explanations_df['condition'] == condition]
-            condition_text = ' '.join(condition_data['explanation'].astype(str))
-            
             wordcloud = WordCloud(
                 width=400, height=300, 
                 background_color='white',
-                stopwords=stopwords,
                 max_words=50,
                 colormap='Set2'
-            ).generate(condition_text)
+            ).generate_from_frequencies(frequencies[condition])
             
             axes[0, i].imshow(wordcloud, interpolation='bilinear')
             axes[0, i].set_title(f'{condition} Condition', fontsize=14, fontweight='bold')
@@ -108,46 +120,36 @@ class WordCloudGenerator:
         
         # Row 2: Release decisions and overall
         # Accept
-        accept_data = self.explanations_df[self.explanations_df['release_decision'] == 'Yes']
-        accept_text = ' '.join(accept_data['explanation'].astype(str))
-        
         wordcloud_accept = WordCloud(
             width=400, height=300, 
             background_color='white',
-            stopwords=stopwords,
             max_words=50,
             colormap='Greens'
-        ).generate(accept_text)
+        ).generate_from_frequencies(frequencies['Yes'])
         
         axes[1, 0].imshow(wordcloud_accept, interpolation='bilinear')
         axes[1, 0].set_title('Accept Decisions', fontsize=14, fontweight='bold')
         axes[1, 0].axis('off')
         
         # Reject
-        reject_data = self.explanations_df[self.explanations_df['release_decision'] == 'No']
-        reject_text = ' '.join(reject_data['explanation'].astype(str))
-        
         wordcloud_reject = WordCloud(
             width=400, height=300, 
             background_color='white',
-            stopwords=stopwords,
             max_words=50,
             colormap='Reds'
-        ).generate(reject_text)
+        ).generate_from_frequencies(frequencies['No'])
         
         axes[1, 1].imshow(wordcloud_reject, interpolation='bilinear')
         axes[1, 1].set_title('Reject Decisions', fontsize=14, fontweight='bold')
         axes[1, 1].axis('off')
         
         # Overall
-        all_text = ' '.join(self.explanations_df['explanation'].astype(str))
         wordcloud_all = WordCloud(
             width=400, height=300, 
             background_color='white',
-            stopwords=stopwords,
             max_words=50,
             colormap='viridis'
-        ).generate(all_text)
+        ).generate_from_frequencies(frequencies['overall'])
         
         axes[1, 2].imshow(wordcloud_all, interpolation='bilinear')
         axes[1, 2].set_title('Overall Explanations', fontsize=14, fontweight='bold')
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Shared loader for the extracted explanation corpus
+
+Scripts that run in the same process (e.g. word clouds followed by the
+enhanced theme analysis) get the same DataFrame instead of each parsing
+``all_explanations_raw.csv`` again. The lowercased text and the token lists
+(split from the original-case text) are cached on disk as ``all_explanations.parquet`` next to the raw CSV.
+"""
+
+import re
+from functools import lru_cache
+from pathlib import Path
+
+import pandas as pd
+
+try:
+    import pyarrow  # parquet engine for the corpus cache
+    import pyarrow.parquet as pq
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
+# Same token definition WordCloud uses when it splits raw text
+TOKEN_RE = re.compile(r"\w[\w']*")
+
+# Bump when the derived columns change so older parquet caches are rebuilt
+CACHE_VERSION = b'3'
+
+
+@lru_cache(maxsize=None)
+def load_explanations(data_dir="explanation_analysis_output"):
+    """Load the explanation data, reusing the parquet cache when it is current.
+    
+    The returned DataFrame is shared between callers and must not be modified.
+    """
+    data_dir = Path(data_dir)
+    csv_file = data_dir / "all_explanations_raw.csv"
+    parquet_file = data_dir / "all_explanations.parquet"
+    
+    if (PARQUET_AVAILABLE and parquet_file.exists()
+            and parquet_file.stat().st_mtime >= csv_file.stat().st_mtime
+            and (pq.read_schema(parquet_file).metadata or {}).get(b'cache_version') == CACHE_VERSION):
+        return pd.read_parquet(parquet_file, engine='pyarrow')
+    
+    df = pd.read_csv(csv_file)
+    df['pattern'] = df['pattern'].astype(int)
+    
+    # Rows without an explanation (e.g. a literal "None" answer read back as NaN)
+    # have nothing to match or tokenize
+    df = df.dropna(subset=['explanation']).reset_index(drop=True)
+    df['_exp_lower'] = df['explanation'].astype(str).str.lower()
+    df['tokens'] = df['explanation'].str.findall(TOKEN_RE)
+    for column in ['condition', 'release_decision']:
+        df[column] = df[column].astype('category')
+    if PARQUET_AVAILABLE:
+        table = pyarrow.Table.from_pandas(df, preserve_index=False)
+        table = table.replace_schema_metadata({**table.schema.metadata, b'cache_version': CACHE_VERSION})
+        pq.write_table(table, parquet_file, compression='zstd')
+    return df
@@ -29,20 +29,21 @@ import re
 from pathlib import Path
 from scipy import stats
 import warnings
+from data_loader import load_explanations, PARQUET_AVAILABLE
 warnings.filterwarnings('ignore')
 
 class EnhancedThemeAnalyzer:
     def __init__(self, data_dir="explanation_analysis_output"):
         self.data_dir = Path(data_dir)
         self.explanations_df = None
+        self._condition_totals = {}
         self.output_dir = self.data_dir / "enhanced_theme_analysis"
         self.output_dir.mkdir(exist_ok=True)
         
     def load_data(self):
-        """Load the explanation data."""
-        csv_file = self.data_dir / "all_explanations_raw.csv"
-        self.explanations_df = pd.read_csv(csv_file)
-        self.explanations_df['pattern'] = self.explanations_df['pattern'].astype(int)
+        """Load the explanation data (shared with the other analysis scripts)."""
+        self.explanations_df = load_explanations(self.data_dir)
+        self._condition_totals = self.explanations_df['condition'].value_counts().to_dict()
         return self.explanations_df
     
     def analyze_comprehensive_themes(self):
@@ -260,7 +261,7 @@ class EnhancedThemeAnalyzer:
                 condition_df = self.explanations_df[self.explanations_df['condition'] == condition]
                 
                 for _, row in condition_df.iterrows():
-                    explanation = str(row['explanation']).lower()
+                    explanation = row['_exp_lower']
                     
                     # Check if any keywords are present using word boundaries
                     found_keywords = []
@@ -312,16 +313,15 @@ class EnhancedThemeAnalyzer:
         
         results = []
         
+        # Condition totals are computed once in load_data
+        condition_totals = {condition: self._condition_totals.get(condition, 0)
+                            for condition in ['UEQ', 'UEEQ', 'RAW']}
+        
+        # Determine significance threshold once
+        alpha = 0.05
+        alpha_bonferroni = alpha / len(theme_counts)  # Bonferroni correction
+        
         for theme_name, counts in theme_counts.items():
-            # Create contingency table
-            observed = np.array([[counts['UEQ']], [counts['UEEQ']], [counts['RAW']]])
-            
-            # Calculate totals for each condition
-            condition_totals = {}
-            for condition in ['UEQ', 'UEEQ', 'RAW']:
-                condition_df = self.explanations_df[self.explanations_df['condition'] == condition]
-                condition_totals[condition] = len(condition_df)
-            
             # Create full contingency table (present vs not present)
             contingency_table = np.array([
                 [counts['UEQ'], condition_totals['UEQ'] - counts['UEQ']],
@@ -331,14 +331,25 @@ class EnhancedThemeAnalyzer:
             
             # Chi-square test
             chi2_stat, p_value, dof, expected = stats.chi2_contingency(contingency_table)
+            test_used = 'chi2'
+            
+            # Sparse cells violate the chi-square approximation - use Fisher's exact test
+            # on the full 3x2 table; SciPy evaluates it by permutation, seeded so the
+            # p-value is reproducible
+            if (expected < 5).any():
+                p_value = stats.fisher_exact(
+                    contingency_table, method=stats.PermutationMethod(random_state=42)).pvalue
+                test_used = 'fisher_exact'
             
-            # Cramér's V (effect size)
-            n = contingency_table.sum()
-            cramers_v = np.sqrt(chi2_stat / (n * (min(contingency_table.shape) - 1)))
+            # Chi-square statistic and Cramér's V (effect size) are only reported
+            # when the chi-square test is valid
+            if test_used == 'chi2':
+                n = contingency_table.sum()
+                cramers_v = np.sqrt(chi2_stat / (n * (min(contingency_table.shape) - 1)))
+            else:
+                chi2_stat = np.nan
+                cramers_v = np.nan
             
-            # Determine significance
-            alpha = 0.05
-            alpha_bonferroni = alpha / len(theme_counts)  # Bonferroni correction
             is_significant = p_value < alpha_bonferroni
             
             results.append({
@@ -352,16 +363,21 @@ class EnhancedThemeAnalyzer:
                 'ueg_count': counts['UEQ'],
                 'ueeq_count': counts['UEEQ'],
                 'raw_count': counts['RAW'],
-                'hypothesis': themes[theme_name]['hypothesis']
+                'hypothesis': themes[theme_name]['hypothesis'],
+                'test': test_used
             })
             
             print(f"\n{theme_name.upper().replace('_', ' ')}")
-            print(f"  Chi-square: {chi2_stat:.3f}")
-            print(f"  p-value: {p_value:.6f}")
+            if test_used == 'chi2':
+                print(f"  Chi-square: {chi2_stat:.3f}")
+            print(f"  p-value: {p_value:.6f} ({test_used})")
             print(f"  Bonferroni-corrected α: {alpha_bonferroni:.6f}")
             print(f"  Significant: {'YES' if is_significant else 'NO'}")
-            print(f"  Cramér's V: {cramers_v:.3f}")
-            print(f"  Effect size: {self.interpret_cramers_v(cramers_v)}")
+            if test_used == 'chi2':
+                print(f"  Cramér's V: {cramers_v:.3f}")
+                print(f"  Effect size: {self.interpret_cramers_v(cramers_v)}")
+            else:
+                print(f"  Cramér's V: n/a (sparse table, Fisher's exact test)")
             print(f"  Counts - UEQ: {counts['UEQ']}, UEEQ: {counts['UEEQ']}, RAW: {counts['RAW']}")
             print(f"  Hypothesis: {themes[theme_name]['hypothesis']}")
         
@@ -395,22 +411,29 @@ class EnhancedThemeAnalyzer:
         counts_df = pd.DataFrame(theme_counts).T
         counts_df.to_csv(self.output_dir / "enhanced_theme_counts.csv")
         
-        # Save detailed explanations for each theme
+        # Save detailed explanations for all themes as one long-form table
+        all_rows = []
         for theme_name, explanations in theme_explanations.items():
-            theme_data = []
             for condition, exp_list in explanations.items():
                 for exp_info in exp_list:
-                    theme_data.append({
+                    all_rows.append({
+                        'theme': theme_name,
                         'condition': condition,
                         'explanation': exp_info['explanation'],
-                        'keywords_found': ', '.join(exp_info['keywords_found']),
+                        'keywords_found': exp_info['keywords_found'],
                         'pattern': exp_info['pattern'],
                         'release_decision': exp_info['release_decision']
                     })
-            
-            if theme_data:
-                theme_df = pd.DataFrame(theme_data)
-                theme_df.to_csv(self.output_dir / f"{theme_name}_examples.csv", index=False)
+        
+        examples_df = pd.DataFrame(all_rows, columns=['theme', 'condition', 'explanation',
+                                                      'keywords_found', 'pattern', 'release_decision'])
+        examples_df = examples_df.astype({'theme': 'category', 'condition': 'category'})
+        if PARQUET_AVAILABLE:
+            examples_df.to_parquet(self.output_dir / "examples.parquet",
+                                   engine='pyarrow', compression='zstd', index=False)
+        else:
+            examples_df['keywords_found'] = examples_df['keywords_found'].str.join(', ')
+            examples_df.to_csv(self.output_dir / "examples.csv", index=False)
         
         print(f"\nResults saved to {self.output_dir}")
 
@@ -19,10 +19,17 @@ Date: September 2025
 
 import pandas as pd
 import numpy as np
-import re
+import string
 from collections import Counter, defaultdict
+from itertools import chain
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+import io
+import os
 import json
 from pathlib import Path
+import matplotlib
+matplotlib.use('Agg')
 import matplotlib.pyplot as plt
 import seaborn as sns
 from wordcloud import WordCloud
@@ -31,44 +38,54 @@ from nltk.corpus import stopwords
 from nltk.tokenize import word_tokenize
 from nltk.stem import WordNetLemmatizer
 from nltk.sentiment import SentimentIntensityAnalyzer
-from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.feature_extraction.text import HashingVectorizer
 from sklearn.decomposition import LatentDirichletAllocation
-from sklearn.cluster import KMeans
 import warnings
 warnings.filterwarnings('ignore')
+plt.rcParams['agg.path.chunksize'] = 10000
 
-# Download required NLTK data
 try:
-    nltk.data.find('tokenizers/punkt')
-except LookupError:
-    nltk.download('punkt')
+    import pyarrow as pa
+    from pyarrow import csv as pacsv
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
 
-try:
-    nltk.data.find('corpora/stopwords')
-except LookupError:
-    nltk.download('stopwords')
+# pandas' default missing-value strings, so both TSV readers drop the same cells
+NA_VALUES = ['', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan', '1.#IND',
+             '1.#QNAN', '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null']
 
-try:
-    nltk.data.find('corpora/wordnet')
-except LookupError:
-    nltk.download('wordnet')
+class _LettersOnlyTable(dict):
+    """str.translate table keeping ASCII letters and whitespace, dropping everything else."""
+    
+    def __missing__(self, codepoint):
+        char = chr(codepoint)
+        self[codepoint] = codepoint if char in string.ascii_letters or char.isspace() else None
+        return self[codepoint]
 
-try:
-    nltk.data.find('vader_lexicon')
-except LookupError:
-    nltk.download('vader_lexicon')
+LETTERS_ONLY = _LettersOnlyTable()
+
+# NLTK data required by the analyzer: (resource path, download package)
+NLTK_RESOURCES = [
+    ('tokenizers/punkt', 'punkt'),
+    ('corpora/stopwords', 'stopwords'),
+    ('corpora/wordnet', 'wordnet'),
+    ('sentiment/vader_lexicon.zip', 'vader_lexicon'),
+]
 
 class ExplanationAnalyzer:
     def __init__(self, data_file):
         """Initialize the analyzer with the survey data file."""
         self.data_file = data_file
         self.df = None
-        self.explanations_data = []
+        self.explanations_df = None
         self.output_dir = Path("explanation_analysis_output")
         self.output_dir.mkdir(exist_ok=True)
+        self._ensure_nltk_resources()
         
         # Initialize text processing tools
         self.lemmatizer = WordNetLemmatizer()
+        self._lemmatize = lru_cache(maxsize=None)(self.lemmatizer.lemmatize)
         self.sia = SentimentIntensityAnalyzer()
         self.stop_words = set(stopwords.words('english'))
         
@@ -78,19 +95,61 @@ class ExplanationAnalyzer:
             'one', 'also', 'get', 'like', 'good', 'bad', 'well', 'make', 'think'
         ])
     
+    def _ensure_nltk_resources(self):
+        """Download missing NLTK data; later runs skip the probes via a marker file."""
+        nltk_dir = self.output_dir / ".nltk"
+        if str(nltk_dir) not in nltk.data.path:
+            nltk.data.path.append(str(nltk_dir))
+        
+        marker = nltk_dir / "nltk_ok.flag"
+        if marker.exists():
+            return
+        
+        all_available = True
+        for resource, package in NLTK_RESOURCES:
+            try:
+                nltk.data.find(resource)
+            except LookupError:
+                all_available &= bool(nltk.download(package, download_dir=str(nltk_dir)))
+        
+        if all_available:
+            nltk_dir.mkdir(exist_ok=True)
+            marker.touch()
+    
     def load_and_process_data(self):
         """Load the TSV file and extract explanation data."""
         print("Loading survey data...")
         
-        # Read the TSV file
-        self.df = pd.read_csv(self.data_file, sep='\t', low_memory=False)
+        # Read only the columns the analysis uses: the first (StartDate) column to
+        # locate the data rows, ResponseId, and every Release/Explanation column
+        header = pd.read_csv(self.data_file, sep='\t', nrows=0).columns
+        survey_cols = {f"{pattern}_{condition} {field}"
+                       for condition in ['UEQ', 'UEEQ', 'RAW'] for pattern in range(1, 16)
+                       for field in ['Release', 'Explanation']}
+        usecols = [col for i, col in enumerate(header)
+                   if i == 0 or col == 'ResponseId' or col in survey_cols]
+        
+        # Read the TSV file (multithreaded Arrow parser when available)
+        if PYARROW_AVAILABLE:
+            table = pacsv.read_csv(
+                self.data_file,
+                read_options=pacsv.ReadOptions(block_size=8 << 20),
+                parse_options=pacsv.ParseOptions(delimiter='\t', newlines_in_values=True),
+                convert_options=pacsv.ConvertOptions(
+                    include_columns=usecols,
+                    column_types={col: pa.string() for col in usecols},
+                    null_values=NA_VALUES,
+                    strings_can_be_null=True
+                )
+            )
+            self.df = table.to_pandas(types_mapper=pd.ArrowDtype)
+        else:
+            self.df = pd.read_csv(self.data_file, sep='\t', usecols=usecols,
+                                  dtype={col: 'string' for col in usecols}, engine='c')
         
         # Find the actual data start (skip header info)
-        data_start = 0
-        for i, row in self.df.iterrows():
-            if pd.notna(row.iloc[0]) and str(row.iloc[0]).startswith('2025-'):
-                data_start = i
-                break
+        is_data_row = self.df.iloc[:, 0].astype('string').str.startswith('2025-').fillna(False)
+        data_start = int(is_data_row.to_numpy().argmax()) if is_data_row.any() else 0
         
         # Keep only actual response data
         self.df = self.df.iloc[data_start:].reset_index(drop=True)
@@ -104,245 +163,268 @@ class ExplanationAnalyzer:
         """Extract explanations from the survey data."""
         conditions = ['UEQ', 'UEEQ', 'RAW']
         
-        for _, row in self.df.iterrows():
-            response_id = row.get('ResponseId', 'Unknown')
-            
-            for condition in conditions:
-                for pattern in range(1, 16):  # Patterns 1-15
-                    # Column names follow pattern: {pattern}_{condition} {field}
-                    release_col = f"{pattern}_{condition} Release"
-                    explanation_col = f"{pattern}_{condition} Explanation"
-                    
-                    if release_col in row and explanation_col in row:
-                        release_decision = row[release_col]
-                        explanation = row[explanation_col]
-                        
-                        # Only include if we have both release decision and explanation
-                        if pd.notna(release_decision) and pd.notna(explanation) and str(explanation).strip():
-                            self.explanations_data.append({
-                                'response_id': response_id,
-                                'condition': condition,
-                                'pattern': pattern,
-                                'release_decision': str(release_decision).strip(),
-                                'explanation': str(explanation).strip()
-                            })
-        
-        print(f"Extracted {len(self.explanations_data)} explanation entries")
+        # Column names follow pattern: {pattern}_{condition} {field}
+        pairs = [(pattern, condition) for condition in conditions for pattern in range(1, 16)
+                 if f"{pattern}_{condition} Release" in self.df.columns
+                 and f"{pattern}_{condition} Explanation" in self.df.columns]
+        n_rows, n_pairs = len(self.df), len(pairs)
+        
+        # Flatten the wide (response x pair) blocks row-major into preallocated arrays,
+        # which keeps the survey order: response, then condition, then pattern
+        release = self.df[[f"{p}_{c} Release" for p, c in pairs]].to_numpy(dtype=object).ravel()
+        explanation = self.df[[f"{p}_{c} Explanation" for p, c in pairs]].to_numpy(dtype=object).ravel()
+        if 'ResponseId' in self.df.columns:
+            response_id = np.repeat(self.df['ResponseId'].to_numpy(dtype=object), n_pairs)
+        else:
+            response_id = np.full(n_rows * n_pairs, 'Unknown', dtype=object)
+        condition = np.tile(np.array([c for _, c in pairs], dtype=object), n_rows)
+        pattern = np.tile(np.array([p for p, _ in pairs], dtype=np.int8), n_rows)
+        
+        # Only include if we have both release decision and explanation
+        valid = pd.notna(release) & pd.notna(explanation)
+        long_df = pd.DataFrame({
+            'response_id': response_id[valid],
+            'condition': condition[valid],
+            'pattern': pattern[valid],
+            'release_decision': pd.Series(release[valid], dtype=object).astype(str).str.strip(),
+            'explanation': pd.Series(explanation[valid], dtype=object).astype(str).str.strip()
+        })
+        
+        long_df = long_df[long_df['explanation'] != ''].reset_index(drop=True)
+        
+        # Categorical grouping columns so every later groupby works on integer codes
+        decisions = ['Yes', 'No']
+        decisions += sorted(set(long_df['release_decision']) - set(decisions))
+        long_df['condition'] = pd.Categorical(long_df['condition'], categories=conditions)
+        long_df['release_decision'] = pd.Categorical(long_df['release_decision'], categories=decisions)
+        self.explanations_df = long_df
+        
+        print(f"Extracted {len(self.explanations_df)} explanation entries")
     
     def export_grouped_explanations(self):
         """Export explanations grouped by various criteria."""
-        df_explanations = pd.DataFrame(self.explanations_data)
-        
-        # Export by condition
-        self._export_by_condition(df_explanations)
-        
-        # Export by pattern
-        self._export_by_pattern(df_explanations)
-        
-        # Export by release decision
-        self._export_by_release_decision(df_explanations)
-        
-        # Export combined groupings
-        self._export_combined_groups(df_explanations)
-        
-        # Export raw data
-        df_explanations.to_csv(self.output_dir / "all_explanations_raw.csv", index=False)
-        print(f"✓ Exported raw explanations data to {self.output_dir / 'all_explanations_raw.csv'}")
+        df_explanations = self.explanations_df
+        
+        # The exports only read the frame and write separate files, so run them concurrently
+        exports = [
+            self._export_raw,
+            self._export_by_condition,
+            self._export_by_pattern,
+            self._export_by_release_decision,
+            self._export_combined_groups,
+        ]
+        with ThreadPoolExecutor(max_workers=len(exports)) as executor:
+            futures = [executor.submit(export, df_explanations) for export in exports]
+            # Workers return their progress line so it prints in a fixed order;
+            # result() also re-raises any exception from the worker
+            for future in futures:
+                print(future.result())
+    
+    def _export_raw(self, df):
+        """Export the raw explanation data."""
+        df.to_csv(self.output_dir / "all_explanations_raw.csv", index=False)
+        return f"✓ Exported raw explanations data to {self.output_dir / 'all_explanations_raw.csv'}"
     
     def _export_by_condition(self, df):
         """Export explanations grouped by condition."""
         output_file = self.output_dir / "explanations_by_condition.txt"
+        lines = ("Pattern " + df['pattern'].astype(str) + " | " + df['release_decision'].astype(str)
+                 + " | " + df['explanation'].astype(str) + "\n")
         
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write("EXPLANATIONS GROUPED BY CONDITION\n")
-            f.write("=" * 50 + "\n\n")
-            
-            for condition in ['UEQ', 'UEEQ', 'RAW']:
-                condition_data = df[df['condition'] == condition]
-                f.write(f"\n{condition} CONDITION ({len(condition_data)} explanations)\n")
-                f.write("-" * 30 + "\n")
-                
-                for _, row in condition_data.iterrows():
-                    f.write(f"Pattern {row['pattern']} | {row['release_decision']} | {row['explanation']}\n")
-        
-        print(f"✓ Exported explanations by condition to {output_file}")
+        body = io.StringIO()
+        body.write("EXPLANATIONS GROUPED BY CONDITION\n")
+        body.write("=" * 50 + "\n\n")
+        
+        for condition in ['UEQ', 'UEEQ', 'RAW']:
+            condition_lines = lines[df['condition'] == condition]
+            body.write(f"\n{condition} CONDITION ({len(condition_lines)} explanations)\n")
+            body.write("-" * 30 + "\n")
+            body.write(''.join(condition_lines))
+        
+        output_file.write_text(body.getvalue(), encoding='utf-8')
+        return f"✓ Exported explanations by condition to {output_file}"
     
     def _export_by_pattern(self, df):
         """Export explanations grouped by pattern."""
         output_file = self.output_dir / "explanations_by_pattern.txt"
+        lines = (df['condition'].astype(str) + " | " + df['release_decision'].astype(str)
+                 + " | " + df['explanation'].astype(str) + "\n")
         
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write("EXPLANATIONS GROUPED BY PATTERN\n")
-            f.write("=" * 50 + "\n\n")
-            
-            for pattern in range(1, 16):
-                pattern_data = df[df['pattern'] == pattern]
-                f.write(f"\nPATTERN {pattern} ({len(pattern_data)} explanations)\n")
-                f.write("-" * 30 + "\n")
-                
-                for _, row in pattern_data.iterrows():
-                    f.write(f"{row['condition']} | {row['release_decision']} | {row['explanation']}\n")
-        
-        print(f"✓ Exported explanations by pattern to {output_file}")
+        body = io.StringIO()
+        body.write("EXPLANATIONS GROUPED BY PATTERN\n")
+        body.write("=" * 50 + "\n\n")
+        
+        for pattern in range(1, 16):
+            pattern_lines = lines[df['pattern'] == pattern]
+            body.write(f"\nPATTERN {pattern} ({len(pattern_lines)} explanations)\n")
+            body.write("-" * 30 + "\n")
+            body.write(''.join(pattern_lines))
+        
+        output_file.write_text(body.getvalue(), encoding='utf-8')
+        return f"✓ Exported explanations by pattern to {output_file}"
     
     def _export_by_release_decision(self, df):
         """Export explanations grouped by release decision."""
         output_file = self.output_dir / "explanations_by_release_decision.txt"
+        lines = (df['condition'].astype(str) + " | Pattern " + df['pattern'].astype(str)
+                 + " | " + df['explanation'].astype(str) + "\n")
         
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write("EXPLANATIONS GROUPED BY RELEASE DECISION\n")
-            f.write("=" * 50 + "\n\n")
-            
-            for decision in ['Yes', 'No']:
-                decision_data = df[df['release_decision'] == decision]
-                f.write(f"\nRELEASE: {decision} ({len(decision_data)} explanations)\n")
-                f.write("-" * 30 + "\n")
-                
-                for _, row in decision_data.iterrows():
-                    f.write(f"{row['condition']} | Pattern {row['pattern']} | {row['explanation']}\n")
-        
-        print(f"✓ Exported explanations by release decision to {output_file}")
+        body = io.StringIO()
+        body.write("EXPLANATIONS GROUPED BY RELEASE DECISION\n")
+        body.write("=" * 50 + "\n\n")
+        
+        for decision in ['Yes', 'No']:
+            decision_lines = lines[df['release_decision'] == decision]
+            body.write(f"\nRELEASE: {decision} ({len(decision_lines)} explanations)\n")
+            body.write("-" * 30 + "\n")
+            body.write(''.join(decision_lines))
+        
+        output_file.write_text(body.getvalue(), encoding='utf-8')
+        return f"✓ Exported explanations by release decision to {output_file}"
     
     def _export_combined_groups(self, df):
         """Export explanations with combined groupings."""
         output_file = self.output_dir / "explanations_combined_groups.txt"
+        lines = ("  Pattern " + df['pattern'].astype(str).str.ljust(2) + " | "
+                 + df['explanation'].astype(str) + "\n")
         
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write("EXPLANATIONS WITH COMBINED GROUPINGS\n")
-            f.write("=" * 50 + "\n\n")
+        body = io.StringIO()
+        body.write("EXPLANATIONS WITH COMBINED GROUPINGS\n")
+        body.write("=" * 50 + "\n\n")
+        
+        # Group by condition and release decision
+        for condition in ['UEQ', 'UEEQ', 'RAW']:
+            body.write(f"\n{condition} CONDITION\n")
+            body.write("=" * 20 + "\n")
             
-            # Group by condition and release decision
-            for condition in ['UEQ', 'UEEQ', 'RAW']:
-                f.write(f"\n{condition} CONDITION\n")
-                f.write("=" * 20 + "\n")
-                
-                condition_data = df[df['condition'] == condition]
-                
-                for decision in ['Yes', 'No']:
-                    decision_data = condition_data[condition_data['release_decision'] == decision]
-                    f.write(f"\n  Release: {decision} ({len(decision_data)} explanations)\n")
-                    f.write("  " + "-" * 25 + "\n")
-                    
-                    for _, row in decision_data.iterrows():
-                        f.write(f"  Pattern {row['pattern']: <2} | {row['explanation']}\n")
-        
-        print(f"✓ Exported combined groupings to {output_file}")
+            for decision in ['Yes', 'No']:
+                group_lines = lines[(df['condition'] == condition) & (df['release_decision'] == decision)]
+                body.write(f"\n  Release: {decision} ({len(group_lines)} explanations)\n")
+                body.write("  " + "-" * 25 + "\n")
+                body.write(''.join(group_lines))
+        
+        output_file.write_text(body.getvalue(), encoding='utf-8')
+        return f"✓ Exported combined groupings to {output_file}"
     
     def perform_text_analysis(self):
         """Perform comprehensive text analysis."""
         print("\nPerforming text analysis...")
         
-        df = pd.DataFrame(self.explanations_data)
-        
-        # Word frequency analysis
-        self._word_frequency_analysis(df)
-        
-        # Generate word clouds
-        self._generate_word_clouds(df)
+        df = self.explanations_df.copy()
         
-        # Sentiment analysis
-        self._sentiment_analysis(df)
+        # Tokenize every explanation once and reuse the tokens in all steps
+        df['tokens'] = self._preprocess_corpus(df['explanation'])
         
-        # Topic modeling
-        self._topic_modeling(df)
+        # Word frequency analysis
+        word_freqs = self._word_frequency_analysis(df)
+        
+        # SKIP_HEAVY_NLP=1 limits a run to the exports and frequency counts
+        if os.environ.get('SKIP_HEAVY_NLP') == '1':
+            print("  - SKIP_HEAVY_NLP=1: skipping word clouds, sentiment and topic modeling")
+        else:
+            # Generate word clouds
+            self._generate_word_clouds(df, word_freqs)
+            
+            # Sentiment analysis
+            self._sentiment_analysis(df)
+            
+            # Topic modeling
+            self._topic_modeling(df)
         
         # Generate summary statistics
         self._generate_summary_statistics(df)
     
     def _preprocess_text(self, text):
         """Preprocess text for analysis."""
-        # Convert to lowercase
-        text = text.lower()
-        
-        # Remove special characters and digits
-        text = re.sub(r'[^a-zA-Z\s]', '', text)
+        # Convert to lowercase and remove special characters and digits
+        text = text.lower().translate(LETTERS_ONLY)
         
         # Tokenize
         tokens = word_tokenize(text)
         
         # Remove stop words and short words
-        tokens = [self.lemmatizer.lemmatize(token) for token in tokens 
+        tokens = [self._lemmatize(token) for token in tokens 
                  if token not in self.stop_words and len(token) > 2]
         
         return tokens
     
+    def _preprocess_corpus(self, texts):
+        """Preprocess a Series of texts, tokenizing each distinct text only once."""
+        tokens_by_text = {text: self._preprocess_text(text) for text in pd.unique(texts)}
+        return texts.map(tokens_by_text)
+    
     def _word_frequency_analysis(self, df):
         """Analyze word frequencies across different groups."""
         print("  - Analyzing word frequencies...")
         
-        # Overall word frequency
-        all_texts = ' '.join(df['explanation'].tolist())
-        all_tokens = self._preprocess_text(all_texts)
-        word_freq = Counter(all_tokens)
+        # Count all groups in a single streaming pass over the token lists
+        word_freq = Counter()
+        condition_freqs = {condition: Counter() for condition in ['UEQ', 'UEEQ', 'RAW']}
+        decision_freqs = {decision: Counter() for decision in ['Yes', 'No']}
+        for tokens, condition, decision in zip(df['tokens'], df['condition'], df['release_decision']):
+            word_freq.update(tokens)
+            if condition in condition_freqs:
+                condition_freqs[condition].update(tokens)
+            if decision in decision_freqs:
+                decision_freqs[decision].update(tokens)
         
         # Save overall word frequency
         freq_df = pd.DataFrame(word_freq.most_common(50), columns=['word', 'frequency'])
         freq_df.to_csv(self.output_dir / "word_frequency_overall.csv", index=False)
         
         # Word frequency by condition
-        for condition in ['UEQ', 'UEEQ', 'RAW']:
-            condition_texts = ' '.join(df[df['condition'] == condition]['explanation'].tolist())
-            condition_tokens = self._preprocess_text(condition_texts)
-            condition_freq = Counter(condition_tokens)
-            
+        for condition, condition_freq in condition_freqs.items():
             freq_df = pd.DataFrame(condition_freq.most_common(30), columns=['word', 'frequency'])
             freq_df.to_csv(self.output_dir / f"word_frequency_{condition}.csv", index=False)
         
         # Word frequency by release decision
-        for decision in ['Yes', 'No']:
-            decision_texts = ' '.join(df[df['release_decision'] == decision]['explanation'].tolist())
-            decision_tokens = self._preprocess_text(decision_texts)
-            decision_freq = Counter(decision_tokens)
-            
+        for decision, decision_freq in decision_freqs.items():
             freq_df = pd.DataFrame(decision_freq.most_common(30), columns=['word', 'frequency'])
             freq_df.to_csv(self.output_dir / f"word_frequency_release_{decision}.csv", index=False)
+        
+        # Counters keyed by word cloud suffix
+        word_freqs = {'overall': word_freq}
+        word_freqs.update({f"condition_{condition}": freq for condition, freq in condition_freqs.items()})
+        word_freqs.update({f"release_{decision}": freq for decision, freq in decision_freqs.items()})
+        return word_freqs
     
-    def _generate_word_clouds(self, df):
-        """Generate word clouds for different groups."""
+    def _generate_word_clouds(self, df, word_freqs):
+        """Generate word clouds for different groups from their word frequencies."""
         print("  - Generating word clouds...")
         
-        # Overall word cloud
-        all_texts = ' '.join(df['explanation'].tolist())
-        self._create_word_cloud(all_texts, "overall")
-        
-        # Word clouds by condition
-        for condition in ['UEQ', 'UEEQ', 'RAW']:
-            condition_texts = ' '.join(df[df['condition'] == condition]['explanation'].tolist())
-            if condition_texts.strip():
-                self._create_word_cloud(condition_texts, f"condition_{condition}")
-        
-        # Word clouds by release decision
-        for decision in ['Yes', 'No']:
-            decision_texts = ' '.join(df[df['release_decision'] == decision]['explanation'].tolist())
-            if decision_texts.strip():
-                self._create_word_cloud(decision_texts, f"release_{decision}")
+        # Number of explanations behind each cloud; groups under 5 are skipped
+        group_sizes = {'overall': len(df)}
+        group_sizes.update({f"condition_{condition}": count
+                            for condition, count in df['condition'].value_counts().items()})
+        group_sizes.update({f"release_{decision}": count
+                            for decision, count in df['release_decision'].value_counts().items()})
+        
+        # One figure is reused for every cloud
+        fig = plt.figure(figsize=(10, 5))
+        for suffix, word_freq in word_freqs.items():
+            if word_freq and group_sizes.get(suffix, 0) >= 5:
+                self._create_word_cloud(fig, word_freq, suffix)
+        plt.close(fig)
     
-    def _create_word_cloud(self, text, suffix):
+    def _create_word_cloud(self, fig, word_freq, suffix):
         """Create and save a word cloud."""
         try:
-            # Preprocess text
-            tokens = self._preprocess_text(text)
-            processed_text = ' '.join(tokens)
-            
-            if not processed_text.strip():
-                return
-            
             # Create word cloud
             wordcloud = WordCloud(
                 width=800, height=400,
                 background_color='white',
                 max_words=100,
                 colormap='viridis'
-            ).generate(processed_text)
+            ).generate_from_frequencies(dict(word_freq.most_common(100)))
             
             # Save word cloud
-            plt.figure(figsize=(10, 5))
-            plt.imshow(wordcloud, interpolation='bilinear')
-            plt.axis('off')
-            plt.title(f'Word Cloud - {suffix.replace("_", " ").title()}')
-            plt.tight_layout()
-            plt.savefig(self.output_dir / f"wordcloud_{suffix}.png", dpi=300, bbox_inches='tight')
-            plt.close()
+            fig.clear()
+            ax = fig.add_subplot()
+            ax.imshow(wordcloud, interpolation='bilinear')
+            ax.axis('off')
+            ax.set_title(f'Word Cloud - {suffix.replace("_", " ").title()}')
+            fig.tight_layout()
+            fig.savefig(self.output_dir / f"wordcloud_{suffix}.png", dpi=300, bbox_inches='tight')
             
         except Exception as e:
             print(f"    Warning: Could not generate word cloud for {suffix}: {e}")
@@ -351,23 +433,19 @@ class ExplanationAnalyzer:
         """Perform sentiment analysis on explanations."""
         print("  - Analyzing sentiment...")
         
-        # Calculate sentiment scores
-        df['sentiment_compound'] = df['explanation'].apply(
-            lambda x: self.sia.polarity_scores(x)['compound']
-        )
-        df['sentiment_positive'] = df['explanation'].apply(
-            lambda x: self.sia.polarity_scores(x)['pos']
-        )
-        df['sentiment_negative'] = df['explanation'].apply(
-            lambda x: self.sia.polarity_scores(x)['neg']
-        )
-        df['sentiment_neutral'] = df['explanation'].apply(
-            lambda x: self.sia.polarity_scores(x)['neu']
-        )
+        # Calculate sentiment scores (one VADER pass per distinct explanation)
+        scores_by_text = {text: self.sia.polarity_scores(text) for text in pd.unique(df['explanation'])}
+        scores = pd.DataFrame(df['explanation'].map(scores_by_text).tolist(), index=df.index)
+        df['sentiment_compound'] = scores['compound']
+        df['sentiment_positive'] = scores['pos']
+        df['sentiment_negative'] = scores['neg']
+        df['sentiment_neutral'] = scores['neu']
         
         # Categorize sentiment
-        df['sentiment_category'] = df['sentiment_compound'].apply(
-            lambda x: 'positive' if x >= 0.05 else ('negative' if x <= -0.05 else 'neutral')
+        compound = df['sentiment_compound'].to_numpy()
+        df['sentiment_category'] = pd.Categorical(
+            np.select([compound >= 0.05, compound <= -0.05], ['positive', 'negative'], default='neutral'),
+            categories=['negative', 'neutral', 'positive']
         )
         
         # Save sentiment analysis results
@@ -376,7 +454,8 @@ class ExplanationAnalyzer:
         sentiment_results.to_csv(self.output_dir / "sentiment_analysis.csv", index=False)
         
         # Generate sentiment summary
-        sentiment_summary = df.groupby(['condition', 'release_decision', 'sentiment_category']).size().unstack(fill_value=0)
+        sentiment_summary = df.groupby(['condition', 'release_decision', 'sentiment_category'],
+                                       observed=True).size().unstack(fill_value=0)
         sentiment_summary.to_csv(self.output_dir / "sentiment_summary.csv")
         
         # Create sentiment visualization
@@ -387,72 +466,98 @@ class ExplanationAnalyzer:
         fig, axes = plt.subplots(2, 2, figsize=(15, 10))
         
         # Sentiment by condition
-        condition_sentiment = df.groupby(['condition', 'sentiment_category']).size().unstack(fill_value=0)
-        condition_sentiment.plot(kind='bar', ax=axes[0,0], title='Sentiment by Condition')
-        axes[0,0].set_xlabel('Condition')
-        axes[0,0].set_ylabel('Count')
-        axes[0,0].legend(title='Sentiment')
+        self._plot_grouped_bars(axes[0,0], df, 'condition', 'Sentiment by Condition', 'Condition')
         
         # Sentiment by release decision
-        release_sentiment = df.groupby(['release_decision', 'sentiment_category']).size().unstack(fill_value=0)
-        release_sentiment.plot(kind='bar', ax=axes[0,1], title='Sentiment by Release Decision')
-        axes[0,1].set_xlabel('Release Decision')
-        axes[0,1].set_ylabel('Count')
-        axes[0,1].legend(title='Sentiment')
+        self._plot_grouped_bars(axes[0,1], df, 'release_decision', 'Sentiment by Release Decision', 'Release Decision')
         
         # Sentiment scores distribution
-        df['sentiment_compound'].hist(bins=20, ax=axes[1,0], alpha=0.7)
+        axes[1,0].hist(df['sentiment_compound'].to_numpy(), bins=20, alpha=0.7)
+        axes[1,0].grid(True)
         axes[1,0].set_title('Distribution of Sentiment Scores')
         axes[1,0].set_xlabel('Sentiment Score')
         axes[1,0].set_ylabel('Frequency')
         
         # Sentiment by condition (box plot)
-        df.boxplot(column='sentiment_compound', by='condition', ax=axes[1,1])
+        groups = df.groupby('condition', observed=True)['sentiment_compound']
+        labels = list(groups.groups)
+        axes[1,1].boxplot([groups.get_group(label).to_numpy() for label in labels])
+        axes[1,1].set_xticks(np.arange(1, len(labels) + 1), labels)
         axes[1,1].set_title('Sentiment Score Distribution by Condition')
         axes[1,1].set_xlabel('Condition')
         axes[1,1].set_ylabel('Sentiment Score')
         
         plt.tight_layout()
-        plt.savefig(self.output_dir / "sentiment_analysis_plots.png", dpi=300, bbox_inches='tight')
-        plt.close()
+        plt.savefig(self.output_dir / "sentiment_analysis_plots.png", dpi=150, bbox_inches='tight')
+        plt.close(fig)
+    
+    def _plot_grouped_bars(self, ax, df, group_col, title, xlabel):
+        """Draw sentiment category counts per group as side-by-side bars."""
+        pivot = df.pivot_table(index=group_col, columns='sentiment_category', values='explanation',
+                               aggfunc='size', fill_value=0, observed=True)
+        counts = pivot.to_numpy()
+        x = np.arange(len(pivot.index))
+        width = 0.8 / max(len(pivot.columns), 1)
+        for i, category in enumerate(pivot.columns):
+            offset = (i - (len(pivot.columns) - 1) / 2) * width
+            ax.bar(x + offset, counts[:, i], width, label=category)
+        ax.set_xticks(x, pivot.index.astype(str), rotation=90)
+        ax.set_title(title)
+        ax.set_xlabel(xlabel)
+        ax.set_ylabel('Count')
+        ax.legend(title='Sentiment')
     
     def _topic_modeling(self, df):
         """Perform topic modeling using LDA."""
         print("  - Performing topic modeling...")
         
         try:
-            # Prepare texts
-            texts = df['explanation'].tolist()
-            processed_texts = [' '.join(self._preprocess_text(text)) for text in texts]
-            processed_texts = [text for text in processed_texts if text.strip()]
+            # Prepare texts (skip explanations with no tokens left after preprocessing)
+            has_tokens = df['tokens'].str.len() > 0
+            processed_texts = df.loc[has_tokens, 'tokens'].str.join(' ').tolist()
             
-            if len(processed_texts) < 10:
+            # Scale the model to the corpus: skip tiny corpora, drop bigrams for small ones
+            n_docs = len(processed_texts)
+            if n_docs < 10:
                 print("    Warning: Too few texts for meaningful topic modeling")
                 return
+            elif n_docs < 100:
+                ngram_range = (1, 1)
+                n_topics = min(3, n_docs // 10)
+            else:
+                ngram_range = (1, 2)
+                n_topics = min(5, n_docs // 4)  # Adaptive number of topics
             
-            # Vectorize texts
-            vectorizer = TfidfVectorizer(
-                max_features=100,
-                min_df=2,
-                max_df=0.8,
-                ngram_range=(1, 2)
+            # Vectorize texts with the hashing trick (no vocabulary building pass)
+            vectorizer = HashingVectorizer(
+                n_features=1024,
+                ngram_range=ngram_range,
+                alternate_sign=False,
+                norm=None,
+                dtype=np.float32
             )
             
-            doc_term_matrix = vectorizer.fit_transform(processed_texts)
+            # The hashing vectorizer is stateless, so documents are vectorized
+            # minibatch by minibatch and the full matrix is never built
+            chunk_size = 256
+            chunks = [processed_texts[i:i + chunk_size] for i in range(0, len(processed_texts), chunk_size)]
             
             # Perform LDA
-            n_topics = min(5, len(processed_texts) // 4)  # Adaptive number of topics
             lda = LatentDirichletAllocation(
                 n_components=n_topics,
                 random_state=42,
-                max_iter=10,
-                learning_method='online'
+                learning_method='online',
+                batch_size=128,
+                total_samples=n_docs
             )
             
-            lda.fit(doc_term_matrix)
+            for _ in range(10):  # Same number of passes as fit(max_iter=10)
+                for chunk in chunks:
+                    lda.partial_fit(vectorizer.transform(chunk))
             
             # Extract topics
-            feature_names = vectorizer.get_feature_names_out()
+            feature_names = self._hashed_feature_names(df.loc[has_tokens, 'tokens'], vectorizer.n_features,
+                                                       bigrams=ngram_range[1] == 2)
             topics = []
             
             for topic_idx, topic in enumerate(lda.components_):
@@ -468,10 +573,10 @@ class ExplanationAnalyzer:
                 json.dump(topics, f, indent=2)
             
             # Save topic assignments
-            doc_topic_probs = lda.transform(doc_term_matrix)
+            doc_topic_probs = np.vstack([lda.transform(vectorizer.transform(chunk)) for chunk in chunks])
             topic_assignments = doc_topic_probs.argmax(axis=1)
             
-            df_subset = df.iloc[:len(topic_assignments)].copy()
+            df_subset = df[has_tokens].copy()
             df_subset['topic'] = topic_assignments
             df_subset['topic_probability'] = doc_topic_probs.max(axis=1)
             
@@ -480,30 +585,55 @@ class ExplanationAnalyzer:
             topic_results.to_csv(self.output_dir / "topic_assignments.csv", index=False)
             
             # Generate topic summary
-            topic_summary = df_subset.groupby(['condition', 'release_decision', 'topic']).size().unstack(fill_value=0)
+            topic_summary = df_subset.groupby(['condition', 'release_decision', 'topic'],
+                                              observed=True).size().unstack(fill_value=0)
             topic_summary.to_csv(self.output_dir / "topic_summary.csv")
             
         except Exception as e:
             print(f"    Warning: Topic modeling failed: {e}")
     
+    def _hashed_feature_names(self, token_lists, n_features, bigrams=True):
+        """Label each hash bucket with its most frequent unigram (or bigram)."""
+        term_counts = Counter()
+        for tokens in token_lists:
+            term_counts.update(tokens)
+            if bigrams:
+                term_counts.update(' '.join(pair) for pair in zip(tokens, tokens[1:]))
+        
+        # Hash every term on its own with the same hasher to find its bucket
+        terms = list(term_counts)
+        term_hasher = HashingVectorizer(n_features=n_features, alternate_sign=False,
+                                        norm=None, analyzer=lambda term: [term])
+        buckets = term_hasher.transform(terms).indices
+        
+        feature_names = [''] * n_features
+        best_counts = [0] * n_features
+        for term, bucket in zip(terms, buckets):
+            if term_counts[term] > best_counts[bucket]:
+                best_counts[bucket] = term_counts[term]
+                feature_names[bucket] = term
+        return feature_names
+    
     def _generate_summary_statistics(self, df):
         """Generate summary statistics."""
         print("  - Generating summary statistics...")
         
+        # Explanation lengths, computed once for all aggregates
+        df['_len'] = df['explanation'].str.len().astype('int32')
+        
         summary = {
             'total_explanations': len(df),
             'explanations_by_condition': df['condition'].value_counts().to_dict(),
             'explanations_by_release': df['release_decision'].value_counts().to_dict(),
             'explanations_by_pattern': df['pattern'].value_counts().to_dict(),
-            'average_explanation_length': df['explanation'].str.len().mean(),
-            'median_explanation_length': df['explanation'].str.len().median(),
-            'explanation_length_by_condition': df.groupby('condition')['explanation'].str.len().mean().to_dict(),
-            'explanation_length_by_release': df.groupby('release_decision')['explanation'].str.len().mean().to_dict()
+            'average_explanation_length': df['_len'].mean(),
+            'median_explanation_length': df['_len'].median(),
+            'explanation_length_by_condition': df.groupby('condition', observed=True)['_len'].mean().to_dict(),
+            'explanation_length_by_release': df.groupby('release_decision', observed=True)['_len'].mean().to_dict()
         }
         
         # Add text statistics
-        all_text = ' '.join(df['explanation'].tolist())
-        all_tokens = self._preprocess_text(all_text)
+        all_tokens = list(chain.from_iterable(df['tokens']))
         
         summary['total_unique_words'] = len(set(all_tokens))
         summary['total_words'] = len(all_tokens)
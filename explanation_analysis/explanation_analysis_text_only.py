@@ -12,14 +12,142 @@ Date: September 2025
 import csv
 import json
 import re
+from bisect import bisect_right
 from collections import Counter, defaultdict
+from functools import lru_cache
+from itertools import accumulate
 from pathlib import Path
 
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+def _is_word_char(ch):
+    """Return True for characters the regex word class matches."""
+    return ch.isalnum() or ch == '_'
+
+# Terms tallied per condition, matched like str.count; 'unethical' is tried
+# before 'ethical' so the longer word wins where both start
+COMPARISON_TERMS_RE = re.compile(r'unethical|ethical|score|user|business|data|experience')
+
+# Explanation tokens, split the way the regex word class does
+WORD_RE = re.compile(r'\w+')
+
+# Fixed label sets, encoded as small ints to index the count tables
+CONDITIONS = ('UEQ', 'UEEQ', 'RAW')
+RELEASES = ('Yes', 'No')
+CONDITION_INDEX = {condition: i for i, condition in enumerate(CONDITIONS)}
+RELEASE_INDEX = {release: i for i, release in enumerate(RELEASES)}
+
+# Keyword table tags for the combined matcher
+THEME_TABLE = 0
+PATTERN_TABLE = 1
+
+# Theme keywords based on UX and ethics research
+THEMES = {
+    'usability': ('usability', 'usable', 'easy', 'difficult', 'hard', 'confusing', 'clear', 'unclear', 'intuitive', 'complicated'),
+    'business_value': ('business', 'profit', 'revenue', 'cost', 'value', 'money', 'commercial', 'financial', 'economic'),
+    'user_experience': ('experience', 'satisfaction', 'frustration', 'enjoyable', 'annoying', 'pleasant', 'unpleasant'),
+    'ethics_manipulation': ('manipulative', 'deceptive', 'misleading', 'unethical', 'ethical', 'honest', 'transparent', 'fair', 'unfair'),
+    'user_autonomy': ('autonomy', 'control', 'choice', 'freedom', 'forced', 'pressure', 'coerce', 'voluntary', 'involuntary'),
+    'trust': ('trust', 'trustworthy', 'suspicious', 'reliable', 'credible', 'believable', 'doubt'),
+    'design_quality': ('attractive', 'aesthetics', 'beautiful', 'ugly', 'appealing', 'professional', 'polished', 'crude'),
+    'functionality': ('functional', 'working', 'broken', 'bugs', 'issues', 'problems', 'effective', 'efficient', 'ineffective'),
+    'engagement': ('engaging', 'addictive', 'boring', 'interesting', 'captivating', 'stimulating', 'dull'),
+    'cognitive_load': ('overwhelming', 'simple', 'complex', 'cognitive', 'mental', 'effort', 'strain', 'load')
+}
+
+# Decision-making language patterns
+DECISION_PATTERNS = {
+    'certainty_high': ('definitely', 'certainly', 'clearly', 'obviously', 'absolutely', 'without doubt'),
+    'certainty_low': ('maybe', 'perhaps', 'possibly', 'might', 'could be', 'seems like'),
+    'data_reliance': ('based on', 'according to', 'data shows', 'scores indicate', 'metrics suggest'),
+    'emotional_response': ('feel', 'feeling', 'sense', 'gut', 'instinct', 'impression'),
+    'comparative': ('better than', 'worse than', 'compared to', 'relative to', 'versus'),
+    'conditional': ('if', 'unless', 'provided that', 'assuming', 'depends on'),
+    'risk_averse': ('risk', 'risky', 'dangerous', 'safe', 'caution', 'careful'),
+    'user_focus': ('user needs', 'user wants', 'user experience', 'for users', 'user-friendly'),
+    'business_focus': ('business needs', 'company', 'organization', 'profit', 'revenue', 'commercial')
+}
+
+def _compile_keyword_matcher(keyword_groups):
+    """Compile keyword groups for whole-word matching.
+    
+    Returns (owners, words, scanner): owners maps each keyword to the (group,
+    (position, keyword)) entries that list it; words is the frozenset of
+    single-token keywords, intersected with each explanation's tokens; scanner
+    finds the multi-token phrases (one Hyperscan database when hyperscan is
+    installed, else one Aho-Corasick automaton when pyahocorasick is, else one
+    regex alternation) and is None when there are no phrases.
+    """
+    owners = defaultdict(list)
+    for group, keywords in keyword_groups.items():
+        for position, kw in enumerate(keywords):
+            owners[kw].append((group, (position, kw)))
+    
+    words = frozenset(kw for kw in owners if WORD_RE.fullmatch(kw))
+    phrases = [kw for kw in owners if not WORD_RE.fullmatch(kw)]
+    if not phrases:
+        return owners, words, None
+    
+    if HYPERSCAN_AVAILABLE:
+        # Hyperscan's \b is ASCII-only, so phrases compile as literals and
+        # boundaries are checked on the hits like the automaton's
+        database = hyperscan.Database()
+        database.compile(expressions=[re.escape(kw).encode() for kw in phrases],
+                         ids=list(range(len(phrases))),
+                         elements=len(phrases),
+                         flags=[hyperscan.HS_FLAG_SOM_LEFTMOST] * len(phrases))
+        return owners, words, database
+    
+    if not AHOCORASICK_AVAILABLE:
+        alternation = '|'.join(re.escape(kw) for kw in sorted(phrases, key=len, reverse=True))
+        return owners, words, re.compile(r'\b(?:' + alternation + r')\b')
+    
+    automaton = ahocorasick.Automaton()
+    for kw in phrases:
+        automaton.add_word(kw, kw)
+    automaton.make_automaton()
+    return owners, words, automaton
+
+@lru_cache(maxsize=None)
+def _keyword_matcher():
+    """Return the matcher over both keyword tables, compiled on first use.
+    
+    Groups are keyed by (table, index). Keywords match as whole words ("hard"
+    does not match "hardly").
+    """
+    keyword_groups = {(THEME_TABLE, i): keywords for i, keywords in enumerate(THEMES.values())}
+    keyword_groups.update({(PATTERN_TABLE, i): keywords for i, keywords in enumerate(DECISION_PATTERNS.values())})
+    return _compile_keyword_matcher(keyword_groups)
+
 class TextOnlyAnalyzer:
     def __init__(self, data_dir="explanation_analysis_output"):
         """Initialize with the output directory from the simple analysis."""
         self.data_dir = Path(data_dir)
+        self.columns = []
         self.explanations_data = []
+        self.lowered_explanations = []
+        self.token_sets = []
+        self.cell_ids = []
+        self._combination_totals = Counter()
+        self._condition_totals = Counter()
+        self._release_totals = Counter()
+        self._aggregates = None
         
         # Load the extracted data
         self._load_extracted_data()
@@ -32,33 +160,131 @@ class TextOnlyAnalyzer:
             print(f"Error: {csv_file} not found. Run the simple analysis first.")
             return
         
+        # Rows are kept as tuples in CSV column order; the header names the columns
         with open(csv_file, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            self.explanations_data = list(reader)
+            reader = csv.reader(f)
+            self.columns = next(reader, [])
+            self.explanations_data = [tuple(row) for row in reader]
+        
+        if not self.explanations_data:
+            return
+        
+        explanation_col = self.columns.index('explanation')
+        condition_col = self.columns.index('condition')
+        release_col = self.columns.index('release_decision')
+        
+        # Lowercase every explanation once for all analyses (kept out of the rows
+        # so they serialize unchanged)
+        self.lowered_explanations = [row[explanation_col].lower() for row in self.explanations_data]
+        self.token_sets = [frozenset(WORD_RE.findall(text)) for text in self.lowered_explanations]
+        self.cell_ids = [(CONDITION_INDEX[row[condition_col]], RELEASE_INDEX[row[release_col]])
+                         for row in self.explanations_data]
+        
+        # Report denominators for every condition/decision cell, counted once
+        for (ci, ri), count in Counter(self.cell_ids).items():
+            self._combination_totals[(CONDITIONS[ci], RELEASES[ri])] = count
+            self._condition_totals[CONDITIONS[ci]] += count
+            self._release_totals[RELEASES[ri]] += count
         
         print(f"Loaded {len(self.explanations_data)} explanations from previous analysis")
     
-    def analyze_key_themes(self):
-        """Analyze key themes in explanations using scientifically validated categories."""
-        print("Analyzing key themes...")
+    def _iter_keyword_hits(self, text, scanner):
+        """Yield (start, keyword) for every whole-word keyword match in text.
         
-        # Define theme keywords based on UX and ethics research
-        themes = {
-            'usability': ['usability', 'usable', 'easy', 'difficult', 'hard', 'confusing', 'clear', 'unclear', 'intuitive', 'complicated'],
-            'business_value': ['business', 'profit', 'revenue', 'cost', 'value', 'money', 'commercial', 'financial', 'economic'],
-            'user_experience': ['experience', 'satisfaction', 'frustration', 'enjoyable', 'annoying', 'pleasant', 'unpleasant'],
-            'ethics_manipulation': ['manipulative', 'deceptive', 'misleading', 'unethical', 'ethical', 'honest', 'transparent', 'fair', 'unfair'],
-            'user_autonomy': ['autonomy', 'control', 'choice', 'freedom', 'forced', 'pressure', 'coerce', 'voluntary', 'involuntary'],
-            'trust': ['trust', 'trustworthy', 'suspicious', 'reliable', 'credible', 'believable', 'doubt'],
-            'design_quality': ['attractive', 'aesthetics', 'beautiful', 'ugly', 'appealing', 'professional', 'polished', 'crude'],
-            'functionality': ['functional', 'working', 'broken', 'bugs', 'issues', 'problems', 'effective', 'efficient', 'ineffective'],
-            'engagement': ['engaging', 'addictive', 'boring', 'interesting', 'captivating', 'stimulating', 'dull'],
-            'cognitive_load': ['overwhelming', 'simple', 'complex', 'cognitive', 'mental', 'effort', 'strain', 'load']
-        }
+        Starts are character offsets, except for a Hyperscan scanner, which works on
+        the UTF-8 encoded text and yields byte offsets.
+        """
+        if isinstance(scanner, re.Pattern):
+            for match in scanner.finditer(text):
+                yield match.start(), match.group()
+            return
+        
+        if HYPERSCAN_AVAILABLE and isinstance(scanner, hyperscan.Database):
+            data = text.encode()
+            spans = []
+            scanner.scan(data, match_event_handler=lambda _id, start, end, _flags, _context: spans.append((start, end)))
+            for start, end in spans:
+                # Decode the neighbouring characters; partial sequences are dropped
+                before = data[max(start - 4, 0):start].decode(errors='ignore')[-1:]
+                after = data[end:end + 4].decode(errors='ignore')[:1]
+                if not (before and _is_word_char(before)) and not (after and _is_word_char(after)):
+                    yield start, data[start:end].decode()
+            return
+        
+        # Automaton matches are substrings; keep only those on word boundaries
+        last = len(text) - 1
+        for end, kw in scanner.iter(text):
+            start = end - len(kw) + 1
+            if ((start == 0 or not _is_word_char(text[start - 1])) and
+                    (end == last or not _is_word_char(text[end + 1]))):
+                yield start, kw
+    
+    def _scan_corpus(self, matcher):
+        """Find keywords in every explanation.
+        
+        Single-token keywords are found by intersecting each explanation's tokens
+        with the keyword set, owners mapping every hit to its groups. Phrases
+        are found with one scan over the lowercased explanations joined into a single
+        buffer separated by newlines (a word boundary no keyword spans), each hit
+        mapped back to its explanation through the start offsets. Returns one
+        {group: {(position, keyword), ...}} dict per explanation; only groups with a
+        hit are present, so membership alone answers whether a group matched.
+        """
+        owners, words, scanner = matcher
+        hits = [set() for _ in self.lowered_explanations]
+        
+        if scanner is not None:
+            lengths = map(len, self.lowered_explanations[:-1])
+            if HYPERSCAN_AVAILABLE and isinstance(scanner, hyperscan.Database):
+                # Hyperscan hits are byte offsets into the encoded buffer
+                lengths = (len(text.encode()) for text in self.lowered_explanations[:-1])
+            starts = list(accumulate((length + 1 for length in lengths), initial=0))
+            corpus = '\n'.join(self.lowered_explanations)
+            for start, kw in self._iter_keyword_hits(corpus, scanner):
+                hits[bisect_right(starts, start) - 1].update(owners[kw])
+        
+        for explanation_hits, tokens in zip(hits, self.token_sets):
+            for kw in tokens & words:
+                explanation_hits.update(owners[kw])
+        
+        found = []
+        for explanation_hits in hits:
+            by_group = {}
+            for group, entry in explanation_hits:
+                by_group.setdefault(group, set()).add(entry)
+            found.append(by_group)
+        return found
+    
+    def _ordered_keywords(self, entries):
+        """Return the keywords of a group's hit entries in keyword-list order."""
+        return [kw for _, kw in sorted(entries)]
+    
+    def _write_json(self, filename, data, compact=False):
+        """Save an analysis result as JSON, using orjson when installed.
+        
+        Output is indented unless compact is set, which drops all whitespace.
+        """
+        path = self.data_dir / filename
+        if ORJSON_AVAILABLE:
+            path.write_bytes(orjson.dumps(data) if compact else orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(path, 'w') as f:
+                if compact:
+                    json.dump(data, f, separators=(',', ':'))
+                else:
+                    json.dump(data, f, indent=2)
+    
+    def _scan_all(self):
+        """Walk the corpus once, collecting theme, pattern and condition aggregates.
+        
+        The three public analyses save and report slices of this result, so the
+        explanations are scanned a single time however many of them run.
+        """
+        if self._aggregates is not None:
+            return self._aggregates
         
-        # Count theme occurrences
         theme_counts = {}
-        for theme in themes:
+        for theme in THEMES:
             theme_counts[theme] = {
                 'total': 0,
                 'by_condition': {'UEQ': 0, 'UEEQ': 0, 'RAW': 0},
@@ -67,148 +293,199 @@ class TextOnlyAnalyzer:
                 'specific_mentions': []
             }
         
-        for explanation_data in self.explanations_data:
-            explanation = explanation_data['explanation'].lower()
-            condition = explanation_data['condition']
-            release = explanation_data['release_decision']
-            pattern = explanation_data['pattern']
-            combination_key = f"{condition}_{release}"
+        pattern_analysis = {}
+        for pattern_name in DECISION_PATTERNS:
+            pattern_analysis[pattern_name] = {
+                'total': 0,
+                'by_condition': {'UEQ': 0, 'UEEQ': 0, 'RAW': 0},
+                'by_release': {'Yes': 0, 'No': 0},
+                'examples': []
+            }
+        
+        comparison = {
+            'UEQ': {'explanations': [], 'characteristics': {}},
+            'UEEQ': {'explanations': [], 'characteristics': {}},
+            'RAW': {'explanations': [], 'characteristics': {}}
+        }
+        
+        theme_names = list(THEMES)
+        pattern_names = list(DECISION_PATTERNS)
+        
+        # Hit counts per [group][condition][release] cell; marginals are derived below
+        theme_cells = [[[0] * len(RELEASES) for _ in CONDITIONS] for _ in theme_names]
+        pattern_cells = [[[0] * len(RELEASES) for _ in CONDITIONS] for _ in pattern_names]
+        decision_cells = [[0] * len(RELEASES) for _ in CONDITIONS]
+        length_sums = [0] * len(CONDITIONS)
+        term_counts = [Counter() for _ in CONDITIONS]
+        
+        explanation_col = self.columns.index('explanation')
+        pattern_col = self.columns.index('pattern')
+        
+        for row, explanation, (ci, ri), found in zip(self.explanations_data, self.lowered_explanations,
+                                                     self.cell_ids, self._scan_corpus(_keyword_matcher())):
+            condition = CONDITIONS[ci]
+            release = RELEASES[ri]
+            pattern = row[pattern_col]
             
-            for theme, keywords in themes.items():
-                found_keywords = [kw for kw in keywords if kw in explanation]
-                if found_keywords:
-                    theme_counts[theme]['total'] += 1
-                    theme_counts[theme]['by_condition'][condition] += 1
-                    theme_counts[theme]['by_release'][release] += 1
-                    
-                    if combination_key not in theme_counts[theme]['by_combination']:
-                        theme_counts[theme]['by_combination'][combination_key] = 0
-                    theme_counts[theme]['by_combination'][combination_key] += 1
+            for (table, group), entries in found.items():
+                if table == THEME_TABLE:
+                    theme_cells[group][ci][ri] += 1
                     
                     # Store specific mentions for qualitative analysis
-                    theme_counts[theme]['specific_mentions'].append({
+                    theme_counts[theme_names[group]]['specific_mentions'].append({
                         'condition': condition,
                         'release': release,
                         'pattern': pattern,
-                        'keywords_found': found_keywords,
+                        'keywords_found': self._ordered_keywords(entries),
                         'explanation_snippet': explanation[:100] + '...' if len(explanation) > 100 else explanation
                     })
+                else:
+                    pattern_cells[group][ci][ri] += 1
+                    
+                    # Store examples; once three are kept, a hit only counts
+                    examples = pattern_analysis[pattern_names[group]]['examples']
+                    if len(examples) < 3:
+                        examples.append({
+                            'condition': condition,
+                            'release': release,
+                            'keywords': self._ordered_keywords(entries),
+                            'snippet': explanation[:150] + '...' if len(explanation) > 150 else explanation
+                        })
+            
+            # Per-condition aggregates for the comparison
+            comparison[condition]['explanations'].append(row)
+            decision_cells[ci][ri] += 1
+            length_sums[ci] += len(row[explanation_col])
+            term_counts[ci].update(COMPARISON_TERMS_RE.findall(explanation))
+        
+        # Convert the count tables back to the nested-dict result format
+        for cells, (theme, counts) in zip(theme_cells, theme_counts.items()):
+            for ci, condition in enumerate(CONDITIONS):
+                for ri, release in enumerate(RELEASES):
+                    count = cells[ci][ri]
+                    if count:
+                        counts['total'] += count
+                        counts['by_condition'][condition] += count
+                        counts['by_release'][release] += count
+                        counts['by_combination'][(condition, release)] = count
         
-        # Save theme analysis
-        with open(self.data_dir / "theme_analysis_detailed.json", 'w') as f:
-            json.dump(theme_counts, f, indent=2)
+        for cells, counts in zip(pattern_cells, pattern_analysis.values()):
+            for ci, condition in enumerate(CONDITIONS):
+                for ri, release in enumerate(RELEASES):
+                    counts['total'] += cells[ci][ri]
+                    counts['by_condition'][condition] += cells[ci][ri]
+                    counts['by_release'][release] += cells[ci][ri]
+        
+        for ci, condition in enumerate(CONDITIONS):
+            # Calculate characteristics
+            total_explanations = len(comparison[condition]['explanations'])
+            yes_decisions = decision_cells[ci][RELEASE_INDEX['Yes']]
+            no_decisions = decision_cells[ci][RELEASE_INDEX['No']]
+            terms = term_counts[ci]
+            
+            comparison[condition]['characteristics'] = {
+                'total_explanations': total_explanations,
+                'yes_decisions': yes_decisions,
+                'no_decisions': no_decisions,
+                'yes_percentage': (yes_decisions / total_explanations * 100) if total_explanations else 0,
+                'average_length': length_sums[ci] / total_explanations if total_explanations else 0,
+                'mentions_score': terms['score'],
+                'mentions_user': terms['user'],
+                'mentions_business': terms['business'],
+                # 'unethical' also contains 'ethical', so it counts twice as before
+                'mentions_ethical': terms['ethical'] + 2 * terms['unethical'],
+                'mentions_data': terms['data'],
+                'mentions_experience': terms['experience']
+            }
+        
+        self._aggregates = theme_counts, pattern_analysis, comparison
+        return self._aggregates
+    
+    def analyze_key_themes(self):
+        """Analyze key themes in explanations using scientifically validated categories."""
+        print("Analyzing key themes...")
+        
+        theme_counts, _, _ = self._scan_all()
+        
+        # Combinations are (condition, release) tuples; JSON keys are "condition_release"
+        saved_counts = {
+            theme: {**data, 'by_combination': {f"{condition}_{release}": count
+                                               for (condition, release), count in data['by_combination'].items()}}
+            for theme, data in theme_counts.items()
+        }
+        
+        # Save theme analysis; compact, as every theme mention is listed
+        self._write_json("theme_analysis_detailed.json", saved_counts, compact=True)
         
         # Create comprehensive theme report
-        self._create_theme_report(theme_counts, themes)
+        self._create_theme_report(theme_counts, THEMES)
         
         print(f"  ✓ Detailed theme analysis saved to theme_analysis_detailed.json")
-        return theme_counts
+        return saved_counts
     
     def _create_theme_report(self, theme_counts, themes):
         """Create a comprehensive theme analysis report."""
-        with open(self.data_dir / "theme_analysis_comprehensive.txt", 'w') as f:
-            f.write("COMPREHENSIVE THEME ANALYSIS REPORT\n")
-            f.write("=" * 45 + "\n\n")
+        parts = []
+        parts.append("COMPREHENSIVE THEME ANALYSIS REPORT\n")
+        parts.append("=" * 45 + "\n\n")
+        
+        # Overview
+        parts.append("OVERVIEW\n")
+        parts.append("-" * 15 + "\n")
+        total_explanations = len(self.explanations_data)
+        parts.append(f"Total explanations analyzed: {total_explanations}\n\n")
+        
+        # Theme prevalence ranking
+        theme_ranking = sorted(theme_counts.items(), key=lambda x: x[1]['total'], reverse=True)
+        parts.append("THEME PREVALENCE RANKING\n")
+        parts.append("-" * 25 + "\n")
+        for i, (theme, data) in enumerate(theme_ranking, 1):
+            percentage = (data['total'] / total_explanations) * 100
+            parts.append(f"{i:2}. {theme.replace('_', ' ').title(): <20} {data['total']:3} occurrences ({percentage:5.1f}%)\n")
+        
+        parts.append("\n" + "=" * 45 + "\n\n")
+        
+        # Detailed analysis for each theme
+        for theme, data in theme_ranking:
+            parts.append(f"{theme.replace('_', ' ').title().upper()}\n")
+            parts.append("-" * len(theme) + "\n")
+            parts.append(f"Total occurrences: {data['total']} ({(data['total']/total_explanations)*100:.1f}% of explanations)\n\n")
             
-            # Overview
-            f.write("OVERVIEW\n")
-            f.write("-" * 15 + "\n")
-            total_explanations = len(self.explanations_data)
-            f.write(f"Total explanations analyzed: {total_explanations}\n\n")
+            # By condition analysis
+            parts.append("By Condition:\n")
+            for condition in ['UEQ', 'UEEQ', 'RAW']:
+                count = data['by_condition'][condition]
+                condition_total = self._condition_totals[condition]
+                percentage = (count / condition_total) * 100 if condition_total > 0 else 0
+                parts.append(f"  {condition:5}: {count:3} / {condition_total:3} ({percentage:5.1f}%)\n")
             
-            # Theme prevalence ranking
-            theme_ranking = sorted(theme_counts.items(), key=lambda x: x[1]['total'], reverse=True)
-            f.write("THEME PREVALENCE RANKING\n")
-            f.write("-" * 25 + "\n")
-            for i, (theme, data) in enumerate(theme_ranking, 1):
-                percentage = (data['total'] / total_explanations) * 100
-                f.write(f"{i:2}. {theme.replace('_', ' ').title(): <20} {data['total']:3} occurrences ({percentage:5.1f}%)\n")
+            # By release decision analysis
+            parts.append("\nBy Release Decision:\n")
+            for decision in ['Yes', 'No']:
+                count = data['by_release'][decision]
+                decision_total = self._release_totals[decision]
+                percentage = (count / decision_total) * 100 if decision_total > 0 else 0
+                parts.append(f"  {decision:3}: {count:3} / {decision_total:3} ({percentage:5.1f}%)\n")
             
-            f.write("\n" + "=" * 45 + "\n\n")
+            # Combination analysis
+            parts.append("\nBy Condition-Release Combination:\n")
+            for (condition, release), count in sorted(data['by_combination'].items()):
+                combo_total = self._combination_totals[(condition, release)]
+                percentage = (count / combo_total) * 100 if combo_total > 0 else 0
+                parts.append(f"  {condition}-{release}: {count:3} / {combo_total:3} ({percentage:5.1f}%)\n")
             
-            # Detailed analysis for each theme
-            for theme, data in theme_ranking:
-                f.write(f"{theme.replace('_', ' ').title().upper()}\n")
-                f.write("-" * len(theme) + "\n")
-                f.write(f"Total occurrences: {data['total']} ({(data['total']/total_explanations)*100:.1f}% of explanations)\n\n")
-                
-                # By condition analysis
-                f.write("By Condition:\n")
-                for condition in ['UEQ', 'UEEQ', 'RAW']:
-                    count = data['by_condition'][condition]
-                    condition_total = len([d for d in self.explanations_data if d['condition'] == condition])
-                    percentage = (count / condition_total) * 100 if condition_total > 0 else 0
-                    f.write(f"  {condition:5}: {count:3} / {condition_total:3} ({percentage:5.1f}%)\n")
-                
-                # By release decision analysis
-                f.write("\nBy Release Decision:\n")
-                for decision in ['Yes', 'No']:
-                    count = data['by_release'][decision]
-                    decision_total = len([d for d in self.explanations_data if d['release_decision'] == decision])
-                    percentage = (count / decision_total) * 100 if decision_total > 0 else 0
-                    f.write(f"  {decision:3}: {count:3} / {decision_total:3} ({percentage:5.1f}%)\n")
-                
-                # Combination analysis
-                f.write("\nBy Condition-Release Combination:\n")
-                for combination, count in sorted(data['by_combination'].items()):
-                    condition, release = combination.split('_')
-                    combo_total = len([d for d in self.explanations_data 
-                                     if d['condition'] == condition and d['release_decision'] == release])
-                    percentage = (count / combo_total) * 100 if combo_total > 0 else 0
-                    f.write(f"  {condition}-{release}: {count:3} / {combo_total:3} ({percentage:5.1f}%)\n")
-                
-                f.write("\n" + "=" * 45 + "\n\n")
+            parts.append("\n" + "=" * 45 + "\n\n")
+        
+        (self.data_dir / "theme_analysis_comprehensive.txt").write_text(''.join(parts))
     
     def analyze_decision_patterns(self):
         """Analyze patterns in decision-making language."""
         print("Analyzing decision patterns...")
         
-        # Define decision-making language patterns
-        decision_patterns = {
-            'certainty_high': ['definitely', 'certainly', 'clearly', 'obviously', 'absolutely', 'without doubt'],
-            'certainty_low': ['maybe', 'perhaps', 'possibly', 'might', 'could be', 'seems like'],
-            'data_reliance': ['based on', 'according to', 'data shows', 'scores indicate', 'metrics suggest'],
-            'emotional_response': ['feel', 'feeling', 'sense', 'gut', 'instinct', 'impression'],
-            'comparative': ['better than', 'worse than', 'compared to', 'relative to', 'versus'],
-            'conditional': ['if', 'unless', 'provided that', 'assuming', 'depends on'],
-            'risk_averse': ['risk', 'risky', 'dangerous', 'safe', 'caution', 'careful'],
-            'user_focus': ['user needs', 'user wants', 'user experience', 'for users', 'user-friendly'],
-            'business_focus': ['business needs', 'company', 'organization', 'profit', 'revenue', 'commercial']
-        }
-        
-        pattern_analysis = {}
-        for pattern_name in decision_patterns:
-            pattern_analysis[pattern_name] = {
-                'total': 0,
-                'by_condition': {'UEQ': 0, 'UEEQ': 0, 'RAW': 0},
-                'by_release': {'Yes': 0, 'No': 0},
-                'examples': []
-            }
-        
-        for explanation_data in self.explanations_data:
-            explanation = explanation_data['explanation'].lower()
-            condition = explanation_data['condition']
-            release = explanation_data['release_decision']
-            
-            for pattern_name, keywords in decision_patterns.items():
-                found_keywords = [kw for kw in keywords if kw in explanation]
-                if found_keywords:
-                    pattern_analysis[pattern_name]['total'] += 1
-                    pattern_analysis[pattern_name]['by_condition'][condition] += 1
-                    pattern_analysis[pattern_name]['by_release'][release] += 1
-                    
-                    # Store examples
-                    if len(pattern_analysis[pattern_name]['examples']) < 3:
-                        pattern_analysis[pattern_name]['examples'].append({
-                            'condition': condition,
-                            'release': release,
-                            'keywords': found_keywords,
-                            'snippet': explanation[:150] + '...' if len(explanation) > 150 else explanation
-                        })
+        _, pattern_analysis, _ = self._scan_all()
         
         # Save pattern analysis
-        with open(self.data_dir / "decision_patterns.json", 'w') as f:
-            json.dump(pattern_analysis, f, indent=2)
+        self._write_json("decision_patterns.json", pattern_analysis)
         
         # Create decision patterns report
         self._create_decision_patterns_report(pattern_analysis)
@@ -218,91 +495,68 @@ class TextOnlyAnalyzer:
     
     def _create_decision_patterns_report(self, pattern_analysis):
         """Create a decision patterns report."""
-        with open(self.data_dir / "decision_patterns_report.txt", 'w') as f:
-            f.write("DECISION-MAKING PATTERNS ANALYSIS\n")
-            f.write("=" * 40 + "\n\n")
-            
-            total_explanations = len(self.explanations_data)
-            
-            # Pattern prevalence
-            pattern_ranking = sorted(pattern_analysis.items(), key=lambda x: x[1]['total'], reverse=True)
-            
-            f.write("PATTERN PREVALENCE\n")
-            f.write("-" * 18 + "\n")
-            for pattern_name, data in pattern_ranking:
-                percentage = (data['total'] / total_explanations) * 100
-                f.write(f"{pattern_name.replace('_', ' ').title(): <20} {data['total']:3} ({percentage:5.1f}%)\n")
-            
-            f.write("\n" + "=" * 40 + "\n\n")
-            
-            # Detailed analysis
-            for pattern_name, data in pattern_ranking:
-                if data['total'] > 0:
-                    f.write(f"{pattern_name.replace('_', ' ').title().upper()}\n")
-                    f.write("-" * len(pattern_name) + "\n")
-                    
-                    # Condition breakdown
-                    f.write("By Condition:\n")
-                    for condition in ['UEQ', 'UEEQ', 'RAW']:
-                        count = data['by_condition'][condition]
-                        f.write(f"  {condition}: {count}\n")
-                    
-                    # Release decision breakdown
-                    f.write("By Release Decision:\n")
-                    for decision in ['Yes', 'No']:
-                        count = data['by_release'][decision]
-                        f.write(f"  {decision}: {count}\n")
-                    
-                    # Examples
-                    if data['examples']:
-                        f.write("Examples:\n")
-                        for example in data['examples']:
-                            f.write(f"  - [{example['condition']}-{example['release']}] {example['snippet']}\n")
-                    
-                    f.write("\n" + "-" * 40 + "\n\n")
+        parts = []
+        parts.append("DECISION-MAKING PATTERNS ANALYSIS\n")
+        parts.append("=" * 40 + "\n\n")
+        
+        total_explanations = len(self.explanations_data)
+        
+        # Pattern prevalence
+        pattern_ranking = sorted(pattern_analysis.items(), key=lambda x: x[1]['total'], reverse=True)
+        
+        parts.append("PATTERN PREVALENCE\n")
+        parts.append("-" * 18 + "\n")
+        for pattern_name, data in pattern_ranking:
+            percentage = (data['total'] / total_explanations) * 100
+            parts.append(f"{pattern_name.replace('_', ' ').title(): <20} {data['total']:3} ({percentage:5.1f}%)\n")
+        
+        parts.append("\n" + "=" * 40 + "\n\n")
+        
+        # Detailed analysis
+        for pattern_name, data in pattern_ranking:
+            if data['total'] > 0:
+                parts.append(f"{pattern_name.replace('_', ' ').title().upper()}\n")
+                parts.append("-" * len(pattern_name) + "\n")
+                
+                # Condition breakdown
+                parts.append("By Condition:\n")
+                for condition in ['UEQ', 'UEEQ', 'RAW']:
+                    count = data['by_condition'][condition]
+                    parts.append(f"  {condition}: {count}\n")
+                
+                # Release decision breakdown
+                parts.append("By Release Decision:\n")
+                for decision in ['Yes', 'No']:
+                    count = data['by_release'][decision]
+                    parts.append(f"  {decision}: {count}\n")
+                
+                # Examples
+                if data['examples']:
+                    parts.append("Examples:\n")
+                    for example in data['examples']:
+                        parts.append(f"  - [{example['condition']}-{example['release']}] {example['snippet']}\n")
+                
+                parts.append("\n" + "-" * 40 + "\n\n")
+        
+        (self.data_dir / "decision_patterns_report.txt").write_text(''.join(parts))
     
     def create_condition_comparison(self):
         """Create detailed comparison between conditions."""
         print("Creating condition comparison...")
         
-        comparison = {
-            'UEQ': {'explanations': [], 'characteristics': {}},
-            'UEEQ': {'explanations': [], 'characteristics': {}},
-            'RAW': {'explanations': [], 'characteristics': {}}
-        }
+        _, _, comparison = self._scan_all()
         
-        # Collect explanations by condition
-        for condition in ['UEQ', 'UEEQ', 'RAW']:
-            condition_data = [d for d in self.explanations_data if d['condition'] == condition]
-            comparison[condition]['explanations'] = condition_data
-            
-            # Calculate characteristics
-            total_explanations = len(condition_data)
-            yes_decisions = len([d for d in condition_data if d['release_decision'] == 'Yes'])
-            no_decisions = len([d for d in condition_data if d['release_decision'] == 'No'])
-            
-            avg_length = sum(len(d['explanation']) for d in condition_data) / total_explanations if total_explanations else 0
-            
-            # Count specific terms
-            all_text = ' '.join([d['explanation'].lower() for d in condition_data])
-            
-            comparison[condition]['characteristics'] = {
-                'total_explanations': total_explanations,
-                'yes_decisions': yes_decisions,
-                'no_decisions': no_decisions,
-                'yes_percentage': (yes_decisions / total_explanations * 100) if total_explanations else 0,
-                'average_length': avg_length,
-                'mentions_score': all_text.count('score'),
-                'mentions_user': all_text.count('user'),
-                'mentions_business': all_text.count('business'),
-                'mentions_ethical': all_text.count('ethical') + all_text.count('unethical'),
-                'mentions_data': all_text.count('data'),
-                'mentions_experience': all_text.count('experience')
+        # Expand the row tuples into column dicts for the saved comparison
+        comparison = {
+            condition: {
+                'explanations': [dict(zip(self.columns, row)) for row in data['explanations']],
+                'characteristics': data['characteristics']
             }
+            for condition, data in comparison.items()
+        }
         
         # Save comparison
-        with open(self.data_dir / "condition_comparison.json", 'w') as f:
-            json.dump(comparison, f, indent=2, default=str)
+        self._write_json("condition_comparison.json", comparison)
         
         # Create comparison report
         self._create_condition_comparison_report(comparison)
@@ -312,90 +566,92 @@ class TextOnlyAnalyzer:
     
     def _create_condition_comparison_report(self, comparison):
         """Create a detailed condition comparison report."""
-        with open(self.data_dir / "condition_comparison_report.txt", 'w') as f:
-            f.write("CONDITION COMPARISON REPORT\n")
-            f.write("=" * 30 + "\n\n")
-            
-            f.write("SUMMARY STATISTICS\n")
-            f.write("-" * 18 + "\n")
-            f.write(f"{'Metric':<25} {'UEQ':<10} {'UEEQ':<10} {'RAW':<10}\n")
-            f.write("-" * 55 + "\n")
-            
-            metrics = [
-                ('Total Explanations', 'total_explanations'),
-                ('Yes Decisions', 'yes_decisions'),
-                ('No Decisions', 'no_decisions'),
-                ('Yes Percentage', 'yes_percentage'),
-                ('Avg Length (chars)', 'average_length')
-            ]
-            
-            for metric_name, metric_key in metrics:
-                ueeq_val = comparison['UEQ']['characteristics'][metric_key]
-                ueeq_val_formatted = comparison['UEEQ']['characteristics'][metric_key]
-                raw_val = comparison['RAW']['characteristics'][metric_key]
-                
-                if 'percentage' in metric_key or 'average' in metric_key:
-                    f.write(f"{metric_name:<25} {ueeq_val:<10.1f} {ueeq_val_formatted:<10.1f} {raw_val:<10.1f}\n")
-                else:
-                    f.write(f"{metric_name:<25} {ueeq_val:<10} {ueeq_val_formatted:<10} {raw_val:<10}\n")
-            
-            f.write("\n" + "=" * 55 + "\n\n")
-            
-            f.write("TERMINOLOGY USAGE\n")
-            f.write("-" * 17 + "\n")
-            f.write(f"{'Term':<15} {'UEQ':<10} {'UEEQ':<10} {'RAW':<10}\n")
-            f.write("-" * 45 + "\n")
-            
-            terms = [
-                ('Score', 'mentions_score'),
-                ('User', 'mentions_user'),
-                ('Business', 'mentions_business'),
-                ('Ethical', 'mentions_ethical'),
-                ('Data', 'mentions_data'),
-                ('Experience', 'mentions_experience')
-            ]
-            
-            for term_name, term_key in terms:
-                ueeq_count = comparison['UEQ']['characteristics'][term_key]
-                ueeq_count_formatted = comparison['UEEQ']['characteristics'][term_key]
-                raw_count = comparison['RAW']['characteristics'][term_key]
-                f.write(f"{term_name:<15} {ueeq_count:<10} {ueeq_count_formatted:<10} {raw_count:<10}\n")
-            
-            f.write("\n" + "=" * 45 + "\n\n")
-            
-            # Key insights
-            f.write("KEY INSIGHTS\n")
-            f.write("-" * 12 + "\n")
-            
-            # Release rate comparison
-            ueeq_yes_rate = comparison['UEQ']['characteristics']['yes_percentage']
-            ueeq_yes_rate_formatted = comparison['UEEQ']['characteristics']['yes_percentage']
-            raw_yes_rate = comparison['RAW']['characteristics']['yes_percentage']
-            
-            f.write(f"1. Release Rates:\n")
-            f.write(f"   - UEQ: {ueeq_yes_rate:.1f}% yes decisions\n")
-            f.write(f"   - UEEQ: {ueeq_yes_rate_formatted:.1f}% yes decisions\n")
-            f.write(f"   - RAW: {raw_yes_rate:.1f}% yes decisions\n\n")
-            
-            # Length differences
-            ueeq_len = comparison['UEQ']['characteristics']['average_length']
-            ueeq_len_formatted = comparison['UEEQ']['characteristics']['average_length']
-            raw_len = comparison['RAW']['characteristics']['average_length']
-            
-            f.write(f"2. Explanation Length:\n")
-            f.write(f"   - UEQ: {ueeq_len:.1f} characters (shortest)\n")
-            f.write(f"   - UEEQ: {ueeq_len_formatted:.1f} characters (medium)\n")
-            f.write(f"   - RAW: {raw_len:.1f} characters (longest)\n\n")
-            
-            # Score mentions
-            ueeq_score = comparison['UEQ']['characteristics']['mentions_score']
-            ueeq_score_formatted = comparison['UEEQ']['characteristics']['mentions_score']
-            raw_score = comparison['RAW']['characteristics']['mentions_score']
+        parts = []
+        parts.append("CONDITION COMPARISON REPORT\n")
+        parts.append("=" * 30 + "\n\n")
+        
+        parts.append("SUMMARY STATISTICS\n")
+        parts.append("-" * 18 + "\n")
+        parts.append(f"{'Metric':<25} {'UEQ':<10} {'UEEQ':<10} {'RAW':<10}\n")
+        parts.append("-" * 55 + "\n")
+        
+        metrics = [
+            ('Total Explanations', 'total_explanations'),
+            ('Yes Decisions', 'yes_decisions'),
+            ('No Decisions', 'no_decisions'),
+            ('Yes Percentage', 'yes_percentage'),
+            ('Avg Length (chars)', 'average_length')
+        ]
+        
+        for metric_name, metric_key in metrics:
+            ueeq_val = comparison['UEQ']['characteristics'][metric_key]
+            ueeq_val_formatted = comparison['UEEQ']['characteristics'][metric_key]
+            raw_val = comparison['RAW']['characteristics'][metric_key]
             
-            f.write(f"3. Data-Driven Language:\n")
-            f.write(f"   - UEQ: {ueeq_score} mentions of 'score'\n")
-            f.write(f"   - UEEQ: {ueeq_score_formatted} mentions of 'score'\n")
-            f.write(f"   - RAW: {raw_score} mentions of 'score'\n")
+            if 'percentage' in metric_key or 'average' in metric_key:
+                parts.append(f"{metric_name:<25} {ueeq_val:<10.1f} {ueeq_val_formatted:<10.1f} {raw_val:<10.1f}\n")
+            else:
+                parts.append(f"{metric_name:<25} {ueeq_val:<10} {ueeq_val_formatted:<10} {raw_val:<10}\n")
+        
+        parts.append("\n" + "=" * 55 + "\n\n")
+        
+        parts.append("TERMINOLOGY USAGE\n")
+        parts.append("-" * 17 + "\n")
+        parts.append(f"{'Term':<15} {'UEQ':<10} {'UEEQ':<10} {'RAW':<10}\n")
+        parts.append("-" * 45 + "\n")
+        
+        terms = [
+            ('Score', 'mentions_score'),
+            ('User', 'mentions_user'),
+            ('Business', 'mentions_business'),
+            ('Ethical', 'mentions_ethical'),
+            ('Data', 'mentions_data'),
+            ('Experience', 'mentions_experience')
+        ]
+        
+        for term_name, term_key in terms:
+            ueeq_count = comparison['UEQ']['characteristics'][term_key]
+            ueeq_count_formatted = comparison['UEEQ']['characteristics'][term_key]
+            raw_count = comparison['RAW']['characteristics'][term_key]
+            parts.append(f"{term_name:<15} {ueeq_count:<10} {ueeq_count_formatted:<10} {raw_count:<10}\n")
+        
+        parts.append("\n" + "=" * 45 + "\n\n")
+        
+        # Key insights
+        parts.append("KEY INSIGHTS\n")
+        parts.append("-" * 12 + "\n")
+        
+        # Release rate comparison
+        ueeq_yes_rate = comparison['UEQ']['characteristics']['yes_percentage']
+        ueeq_yes_rate_formatted = comparison['UEEQ']['characteristics']['yes_percentage']
+        raw_yes_rate = comparison['RAW']['characteristics']['yes_percentage']
+        
+        parts.append(f"1. Release Rates:\n")
+        parts.append(f"   - UEQ: {ueeq_yes_rate:.1f}% yes decisions\n")
+        parts.append(f"   - UEEQ: {ueeq_yes_rate_formatted:.1f}% yes decisions\n")
+        parts.append(f"   - RAW: {raw_yes_rate:.1f}% yes decisions\n\n")
+        
+        # Length differences
+        ueeq_len = comparison['UEQ']['characteristics']['average_length']
+        ueeq_len_formatted = comparison['UEEQ']['characteristics']['average_length']
+        raw_len = comparison['RAW']['characteristics']['average_length']
+        
+        parts.append(f"2. Explanation Length:\n")
+        parts.append(f"   - UEQ: {ueeq_len:.1f} characters (shortest)\n")
+        parts.append(f"   - UEEQ: {ueeq_len_formatted:.1f} characters (medium)\n")
+        parts.append(f"   - RAW: {raw_len:.1f} characters (longest)\n\n")
+        
+        # Score mentions
+        ueeq_score = comparison['UEQ']['characteristics']['mentions_score']
+        ueeq_score_formatted = comparison['UEEQ']['characteristics']['mentions_score']
+        raw_score = comparison['RAW']['characteristics']['mentions_score']
+        
+        parts.append(f"3. Data-Driven Language:\n")
+        parts.append(f"   - UEQ: {ueeq_score} mentions of 'score'\n")
+        parts.append(f"   - UEEQ: {ueeq_score_formatted} mentions of 'score'\n")
+        parts.append(f"   - RAW: {raw_score} mentions of 'score'\n")
+        
+        (self.data_dir / "condition_comparison_report.txt").write_text(''.join(parts))
 
 def main():
     """Main function to run the text-only analysis."""
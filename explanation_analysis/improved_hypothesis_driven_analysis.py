@@ -35,29 +35,68 @@ Research Questions:
 6. Does the UEEQ condition produce stronger emotional reactions?
 """
 
+import hashlib
 import pandas as pd
 import numpy as np
+import matplotlib
+matplotlib.use('Agg')
 import matplotlib.pyplot as plt
 import seaborn as sns
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from scipy import stats
+from contingency import chi_square_tests
 import warnings
 warnings.filterwarnings('ignore')
 
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
 class ImprovedHypothesisDrivenAnalyzer:
     def __init__(self, data_dir="explanation_analysis_output"):
         self.data_dir = Path(data_dir)
         self.explanations_df = None
+        self._csv_file = None
+        self._corpus = ''
+        self._row_starts = None
+        self._condition_codes = None
+        self._condition_totals = None
+        self._vocabulary_columns = {}
+        self._vocabulary_hits = None
         self.output_dir = self.data_dir / "hypothesis_driven_analysis"
         self.output_dir.mkdir(exist_ok=True)
         
     def load_data(self):
         """Load the explanation data."""
-        csv_file = self.data_dir / "all_explanations_raw.csv"
-        self.explanations_df = pd.read_csv(csv_file)
+        self._csv_file = self.data_dir / "all_explanations_raw.csv"
+        self.explanations_df = pd.read_csv(self._csv_file)
         self.explanations_df['pattern'] = self.explanations_df['pattern'].astype(int)
+        
+        # Rows without an explanation have nothing to match or quote
+        self.explanations_df = self.explanations_df.dropna(subset=['explanation']).reset_index(drop=True)
+        
+        # Lowercase every explanation once for keyword matching
+        self.explanations_df['_expl_lower'] = self.explanations_df['explanation'].astype(str).str.lower()
+        
+        # All lowercased explanations in one buffer, separated by NUL characters
+        # no keyword contains, with the offset at which each row starts
+        lowered = self.explanations_df['_expl_lower'].tolist()
+        self._corpus = '\0'.join(lowered)
+        self._row_starts = np.cumsum([0] + [len(text) + 1 for text in lowered[:-1]])
+        
+        # Condition codes 0-2 (UEQ, UEEQ, RAW; -1 for any other label) and rows per condition
+        self._condition_codes = pd.Categorical(self.explanations_df['condition'],
+                                               categories=['UEQ', 'UEEQ', 'RAW']).codes
+        self._condition_totals = self._count_by_condition(self._condition_codes)
         return self.explanations_df
     
+    def _count_by_condition(self, codes):
+        """Count condition codes into UEQ, UEEQ, RAW bins, ignoring unknown (-1) codes."""
+        return np.bincount(codes + 1, minlength=4)[1:]
+    
     def analyze_hypothesis_driven_patterns(self):
         """
         Analyze hypothesis-driven patterns with comprehensive keyword lists.
@@ -234,13 +273,33 @@ class ImprovedHypothesisDrivenAnalyzer:
             }
         }
         
-        results = {}
-        
-        for pattern_name, pattern_info in patterns.items():
-            results[pattern_name] = self._analyze_pattern_by_condition_comprehensive(
-                pattern_name, pattern_info['keywords'], pattern_info['hypothesis'], 
-                pattern_info['expected_condition']
-            )
+        # Scan once for the deduplicated keywords of all patterns; each pattern
+        # reads its own bits from the shared hit matrix
+        lowered_keywords = {keyword: keyword.lower()
+                            for pattern_info in patterns.values() for keyword in pattern_info['keywords']}
+        vocabulary = sorted(set(lowered_keywords.values()))
+        vocabulary_index = {keyword: i for i, keyword in enumerate(vocabulary)}
+        
+        # Column of every listed keyword, as written in the pattern definitions
+        self._vocabulary_columns = {keyword: vocabulary_index[lowered] for keyword, lowered in lowered_keywords.items()}
+        
+        # Pack each row's hits into 64-bit words: bit k of word k // 64 is keyword k
+        packed = self._cached_packed_hits(vocabulary)
+        packed = np.pad(packed, ((0, 0), (0, -packed.shape[1] % 8)))
+        self._vocabulary_hits = packed.view('<u8')
+        
+        # Patterns only read the shared state, so they are analyzed concurrently;
+        # results keep the definition order
+        with ThreadPoolExecutor(max_workers=len(patterns)) as executor:
+            futures = {
+                pattern_name: executor.submit(
+                    self._analyze_pattern_by_condition_comprehensive,
+                    pattern_name, pattern_info['keywords'], pattern_info['hypothesis'],
+                    pattern_info['expected_condition']
+                )
+                for pattern_name, pattern_info in patterns.items()
+            }
+        results = {pattern_name: future.result() for pattern_name, future in futures.items()}
         
         # Perform statistical tests
         self._perform_comprehensive_statistical_tests(results)
@@ -262,78 +321,166 @@ class ImprovedHypothesisDrivenAnalyzer:
             'statistical_data': {}
         }
         
+        # A row matches when any of the pattern's keyword bits is set
+        columns = [self._vocabulary_columns[keyword] for keyword in keywords]
+        keyword_mask = np.zeros(self._vocabulary_hits.shape[1], dtype='<u8')
+        for column in columns:
+            keyword_mask[column // 64] |= np.uint64(1) << np.uint64(column % 64)
+        row_hits = (self._vocabulary_hits & keyword_mask).any(axis=1)
+        
+        # Examples are sampled reproducibly, independent of the other patterns
+        rng = np.random.default_rng(42)
+        
+        # Matching rows per condition
+        hit_counts = self._count_by_condition(self._condition_codes[row_hits])
+        
+        # Column arrays, indexed by row position
+        explanations = self.explanations_df['explanation'].to_numpy()
+        patterns = self.explanations_df['pattern'].to_numpy()
+        decisions = self.explanations_df['release_decision'].to_numpy()
+        
         # Analyze by condition
-        for condition in ['UEQ', 'UEEQ', 'RAW']:
-            condition_data = self.explanations_df[self.explanations_df['condition'] == condition]
+        for code, condition in enumerate(['UEQ', 'UEEQ', 'RAW']):
+            condition_mask = self._condition_codes == code
+            count = int(hit_counts[code])
+            total = int(self._condition_totals[code])
             
-            matches = []
-            examples = []
-            matched_keywords = []
+            # Check for pattern match with any keyword
+            hit_mask = row_hits[condition_mask]
+            hit_rows = np.flatnonzero(condition_mask & row_hits)
             
-            for _, row in condition_data.iterrows():
-                explanation = str(row['explanation']).lower()
-                
-                # Check for pattern match with any keyword
-                matched_kw = []
-                for keyword in keywords:
-                    if keyword.lower() in explanation:
-                        matched_kw.append(keyword)
-                
-                if matched_kw:  # If any keywords matched
-                    matches.append(row)
-                    matched_keywords.extend(matched_kw)
-                    
-                    if len(examples) < 5:  # Keep top 5 examples per condition
-                        examples.append({
-                            'pattern': row['pattern'],
-                            'decision': row['release_decision'],
-                            'matched_keywords': matched_kw[:3],  # Show first 3 matched keywords
-                            'text': row['explanation'][:400] + '...' if len(row['explanation']) > 400 else row['explanation']
-                        })
+            # Unpack the hit rows' bits to list which keywords they contain
+            keyword_hits = np.unpackbits(self._vocabulary_hits[hit_rows].view(np.uint8), axis=1,
+                                         bitorder='little')[:, columns]
+            
+            matched_keyword_counts = Counter()
+            for row_keyword_hits in keyword_hits:
+                matched_keyword_counts.update(keywords[i] for i in np.flatnonzero(row_keyword_hits))
             
-            # Count unique matched keywords
-            unique_matched_keywords = list(set(matched_keywords))
+            # A uniform sample of up to 5 matching rows as examples, kept in data order;
+            # only these rows' texts are sliced
+            example_positions = np.sort(rng.choice(len(hit_rows), size=min(5, len(hit_rows)), replace=False))
+            
+            examples = []
+            for position in example_positions:
+                row = hit_rows[position]
+                explanation = explanations[row]
+                matched_kw = [keywords[i] for i in np.flatnonzero(keyword_hits[position])]
+                examples.append({
+                    'pattern': patterns[row],
+                    'decision': decisions[row],
+                    'matched_keywords': matched_kw[:3],  # Show first 3 matched keywords
+                    'text': explanation[:400] + '...' if len(explanation) > 400 else explanation
+                })
+            
+            # Most frequently matched keywords, ties in first-matched order
+            top_matched_keywords = matched_keyword_counts.most_common(10)
             
             results['by_condition'][condition] = {
-                'count': len(matches),
-                'total': len(condition_data),
-                'percentage': (len(matches) / len(condition_data)) * 100 if len(condition_data) > 0 else 0,
+                'count': count,
+                'total': total,
+                'percentage': (count / total) * 100 if total > 0 else 0,
                 'examples': examples,
-                'matched_keywords': unique_matched_keywords[:10],  # Top 10 most relevant
-                'keyword_coverage': len(unique_matched_keywords) / len(keywords) * 100
+                'matched_keywords': [keyword for keyword, _ in top_matched_keywords],  # Top 10 most frequent
+                'matched_keyword_counts': dict(top_matched_keywords),
+                'keyword_coverage': len(matched_keyword_counts) / len(keywords) * 100
             }
             
             # Store raw data for statistical tests
-            results['statistical_data'][condition] = [
-                1 if any(keyword.lower() in str(row['explanation']).lower() for keyword in keywords) else 0 
-                for _, row in condition_data.iterrows()
-            ]
+            results['statistical_data'][condition] = hit_mask.astype(int).tolist()
         
         return results
     
+    def _cached_packed_hits(self, vocabulary):
+        """Return the bit-packed hit matrix of the vocabulary, scanning only on a cache miss.
+        
+        The matrix is cached in the output directory under a hash of the CSV
+        contents, the vocabulary, the row count and this script's modification
+        time, so changing the data, the keywords or the preprocessing triggers a
+        fresh scan. A cached matrix whose rows do not match the loaded data is
+        rescanned, and only the latest cache file is kept.
+        """
+        digest = hashlib.blake2b(self._csv_file.read_bytes())
+        digest.update(repr((vocabulary, len(self.explanations_df), Path(__file__).stat().st_mtime_ns)).encode())
+        cache_file = self.output_dir / f"hits_{digest.hexdigest()[:16]}.npz"
+        if cache_file.exists():
+            with np.load(cache_file) as cached:
+                packed = cached['packed']
+            if packed.shape[0] == len(self.explanations_df):
+                print(f"✓ Loaded keyword hits from {cache_file.name}")
+                return packed
+        
+        packed = np.packbits(self._keyword_hit_matrix(vocabulary), axis=1, bitorder='little')
+        assert packed.shape[0] == len(self.explanations_df)
+        for stale_file in self.output_dir.glob("hits_*.npz"):
+            stale_file.unlink()
+        np.savez_compressed(cache_file, packed=packed)
+        return packed
+    
+    def _keyword_hit_matrix(self, keywords):
+        """Mark which of the keywords each explanation contains.
+        
+        Returns a (rows x keywords) uint8 matrix. The lowercased explanations are
+        searched as one buffer, with an Aho-Corasick automaton when pyahocorasick
+        is installed and one bytes.find sweep per keyword over the UTF-8 encoded
+        buffer otherwise; every occurrence is mapped back to its row through the
+        start offsets.
+        """
+        # Matrix columns of each lowercased keyword
+        columns = {}
+        for i, keyword in enumerate(keywords):
+            columns.setdefault(keyword.lower(), []).append(i)
+        
+        starts = []
+        found = []
+        if AHOCORASICK_AVAILABLE:
+            row_starts = self._row_starts
+            automaton = ahocorasick.Automaton()
+            for keyword, indices in columns.items():
+                automaton.add_word(keyword, (len(keyword), indices))
+            automaton.make_automaton()
+            for end, (length, indices) in automaton.iter(self._corpus):
+                starts.append(end - length + 1)
+                found.append(indices)
+        else:
+            # A str buffer stores every character as wide as its widest one (curly
+            # quotes make it two bytes each); UTF-8 keeps ASCII text at one byte, and
+            # byte containment of UTF-8 agrees with str containment
+            corpus = self._corpus.encode()
+            byte_lengths = self.explanations_df['_expl_lower'].str.encode('utf-8').str.len().to_numpy()
+            row_starts = np.concatenate(([0], np.cumsum(byte_lengths[:-1] + 1)))
+            for keyword, indices in columns.items():
+                keyword_bytes = keyword.encode()
+                position = corpus.find(keyword_bytes)
+                while position != -1:
+                    starts.append(position)
+                    found.append(indices)
+                    position = corpus.find(keyword_bytes, position + len(keyword_bytes))
+        
+        hits = np.zeros((len(self.explanations_df), len(keywords)), dtype=np.uint8)
+        if starts:
+            rows = np.searchsorted(row_starts, starts, side='right') - 1
+            hits[np.repeat(rows, [len(indices) for indices in found]), np.concatenate(found)] = 1
+        return hits
+    
     def _perform_comprehensive_statistical_tests(self, results):
         """Perform comprehensive statistical tests with interpretation."""
         print("Performing comprehensive statistical significance tests...")
         
-        for pattern_name, pattern_data in results.items():
-            # Prepare contingency table
-            conditions = ['UEQ', 'UEEQ', 'RAW']
-            
-            # Count matches and non-matches for each condition
-            matches = [pattern_data['by_condition'][cond]['count'] for cond in conditions]
-            totals = [pattern_data['by_condition'][cond]['total'] for cond in conditions]
-            non_matches = [total - match for total, match in zip(totals, matches)]
-            
-            # Create contingency table
-            contingency_table = np.array([matches, non_matches])
-            
-            # Perform chi-square test
-            chi2, p_value, dof, expected = stats.chi2_contingency(contingency_table)
-            
-            # Calculate effect size (Cramér's V)
-            n = np.sum(contingency_table)
-            cramers_v = np.sqrt(chi2 / (n * (min(contingency_table.shape) - 1)))
-            
+        conditions = ['UEQ', 'UEEQ', 'RAW']
+        
+        # Stack the matches/non-matches contingency tables of all patterns (P x 2 x 3)
+        contingency_tables = np.array([
+            [[pattern_data['by_condition'][cond]['count'] for cond in conditions],
+             [pattern_data['by_condition'][cond]['total'] - pattern_data['by_condition'][cond]['count']
+              for cond in conditions]]
+            for pattern_data in results.values()
+        ])
+        
+        chi2_values, p_values, cramers_vs = chi_square_tests(contingency_tables)
+        
+        for pattern_data, contingency_table, chi2, p_value, cramers_v in zip(
+                results.values(), contingency_tables, chi2_values, p_values, cramers_vs):
             # Determine if hypothesis is supported
             expected_cond = pattern_data['expected_condition']
             percentages = {cond: pattern_data['by_condition'][cond]['percentage'] for cond in conditions}
@@ -381,74 +528,79 @@ class ImprovedHypothesisDrivenAnalyzer:
     
     def _save_comprehensive_results(self, results):
         """Save comprehensive statistical analysis with clear interpretation."""
-        with open(self.output_dir / "COMPREHENSIVE_HYPOTHESIS_ANALYSIS.txt", 'w') as f:
-            f.write("COMPREHENSIVE HYPOTHESIS-DRIVEN ANALYSIS\n")
-            f.write("=" * 50 + "\n\n")
+        parts = []
+        parts.append("COMPREHENSIVE HYPOTHESIS-DRIVEN ANALYSIS\n")
+        parts.append("=" * 50 + "\n\n")
+        
+        parts.append("RESEARCH DESIGN:\n")
+        parts.append("-" * 16 + "\n")
+        parts.append("• Statistical tests examine CONDITION DIFFERENCES (UEQ vs UEEQ vs RAW)\n")
+        parts.append("• Keywords derived from comprehensive data examination\n") 
+        parts.append("• Patterns are hypothesis-driven based on observed phenomena\n")
+        parts.append("• Chi-square tests determine if conditions differ significantly\n")
+        parts.append("• Effect sizes (Cramér's V) measure practical significance\n\n")
+        
+        parts.append("HYPOTHESIS TESTING RESULTS:\n")
+        parts.append("-" * 27 + "\n")
+        parts.append(f"{'Pattern':<30} {'Supported':<10} {'p-value':<10} {'Effect':<12} {'Max Condition':<15}\n")
+        parts.append("-" * 77 + "\n")
+        
+        for pattern_name, data in results.items():
+            supported = "YES" if data['statistical_test']['hypothesis_supported'] else "NO"
+            p_val = data['statistical_test']['p_value']
+            effect = data['statistical_test']['effect_size_interpretation']
+            
+            # Find condition with highest percentage
+            percentages = {cond: data['by_condition'][cond]['percentage'] for cond in ['UEQ', 'UEEQ', 'RAW']}
+            max_condition = max(percentages.keys(), key=lambda x: percentages[x])
+            max_pct = f"{max_condition} ({percentages[max_condition]:.1f}%)"
+            
+            parts.append(f"{pattern_name:<30} {supported:<10} {p_val:<10.3f} {effect:<12} {max_pct:<15}\n")
+        
+        parts.append("\n" + "=" * 77 + "\n\n")
+        
+        # Detailed analysis for each pattern
+        for pattern_name, data in results.items():
+            parts.append(f"{pattern_name.upper().replace('_', ' ')}\n")
+            parts.append("-" * len(pattern_name) + "\n")
+            parts.append(f"Hypothesis: {data['hypothesis']}\n")
+            parts.append(f"Expected condition: {data['expected_condition']}\n")
+            parts.append(f"Keywords analyzed: {data['keyword_count']}\n\n")
             
-            f.write("RESEARCH DESIGN:\n")
-            f.write("-" * 16 + "\n")
-            f.write("• Statistical tests examine CONDITION DIFFERENCES (UEQ vs UEEQ vs RAW)\n")
-            f.write("• Keywords derived from comprehensive data examination\n") 
-            f.write("• Patterns are hypothesis-driven based on observed phenomena\n")
-            f.write("• Chi-square tests determine if conditions differ significantly\n")
-            f.write("• Effect sizes (Cramér's V) measure practical significance\n\n")
+            # Statistical results
+            stat_test = data['statistical_test']
+            parts.append(f"STATISTICAL RESULTS:\n")
+            parts.append(f"  Chi-square: χ² = {stat_test['chi2']:.3f}\n")
+            parts.append(f"  P-value: p = {stat_test['p_value']:.3f}\n")
+            parts.append(f"  Effect size: {stat_test['cramers_v']:.3f} ({stat_test['effect_size_interpretation']})\n")
+            parts.append(f"  Statistically significant: {'Yes' if stat_test['significant'] else 'No'}\n")
+            parts.append(f"  Hypothesis supported: {'Yes' if stat_test['hypothesis_supported'] else 'No'}\n\n")
             
-            f.write("HYPOTHESIS TESTING RESULTS:\n")
-            f.write("-" * 27 + "\n")
-            f.write(f"{'Pattern':<30} {'Supported':<10} {'p-value':<10} {'Effect':<12} {'Max Condition':<15}\n")
-            f.write("-" * 77 + "\n")
+            # Condition breakdown with matched keywords
+            parts.append(f"CONDITION BREAKDOWN:\n")
+            for condition in ['UEQ', 'UEEQ', 'RAW']:
+                cond_data = data['by_condition'][condition]
+                parts.append(f"  {condition}: {cond_data['count']}/{cond_data['total']} ({cond_data['percentage']:.1f}%)\n")
+                parts.append(f"    Keyword coverage: {cond_data['keyword_coverage']:.1f}%\n")
+                if cond_data['matched_keywords']:
+                    top_keywords = ', '.join(f"{keyword} ({cond_data['matched_keyword_counts'][keyword]})"
+                                             for keyword in cond_data['matched_keywords'][:5])
+                    parts.append(f"    Top matched keywords: {top_keywords}\n")
             
-            for pattern_name, data in results.items():
-                supported = "YES" if data['statistical_test']['hypothesis_supported'] else "NO"
-                p_val = data['statistical_test']['p_value']
-                effect = data['statistical_test']['effect_size_interpretation']
-                
-                # Find condition with highest percentage
-                percentages = {cond: data['by_condition'][cond]['percentage'] for cond in ['UEQ', 'UEEQ', 'RAW']}
-                max_condition = max(percentages.keys(), key=lambda x: percentages[x])
-                max_pct = f"{max_condition} ({percentages[max_condition]:.1f}%)"
-                
-                f.write(f"{pattern_name:<30} {supported:<10} {p_val:<10.3f} {effect:<12} {max_pct:<15}\n")
+            # Show examples from highest prevalence condition
+            percentages = {cond: data['by_condition'][cond]['percentage'] for cond in ['UEQ', 'UEEQ', 'RAW']}
+            max_condition = max(percentages.keys(), key=lambda x: percentages[x])
             
-            f.write("\n" + "=" * 77 + "\n\n")
+            if data['by_condition'][max_condition]['examples']:
+                parts.append(f"\nEXAMPLES FROM {max_condition} (highest prevalence):\n")
+                for i, ex in enumerate(data['by_condition'][max_condition]['examples'][:3], 1):
+                    parts.append(f"{i}. [P{ex['pattern']}, {ex['decision']}] Keywords: {', '.join(ex['matched_keywords'])}\n")
+                    parts.append(f"   {ex['text'][:200]}...\n\n")
             
-            # Detailed analysis for each pattern
-            for pattern_name, data in results.items():
-                f.write(f"{pattern_name.upper().replace('_', ' ')}\n")
-                f.write("-" * len(pattern_name) + "\n")
-                f.write(f"Hypothesis: {data['hypothesis']}\n")
-                f.write(f"Expected condition: {data['expected_condition']}\n")
-                f.write(f"Keywords analyzed: {data['keyword_count']}\n\n")
-                
-                # Statistical results
-                stat_test = data['statistical_test']
-                f.write(f"STATISTICAL RESULTS:\n")
-                f.write(f"  Chi-square: χ² = {stat_test['chi2']:.3f}\n")
-                f.write(f"  P-value: p = {stat_test['p_value']:.3f}\n")
-                f.write(f"  Effect size: {stat_test['cramers_v']:.3f} ({stat_test['effect_size_interpretation']})\n")
-                f.write(f"  Statistically significant: {'Yes' if stat_test['significant'] else 'No'}\n")
-                f.write(f"  Hypothesis supported: {'Yes' if stat_test['hypothesis_supported'] else 'No'}\n\n")
-                
-                # Condition breakdown with matched keywords
-                f.write(f"CONDITION BREAKDOWN:\n")
-                for condition in ['UEQ', 'UEEQ', 'RAW']:
-                    cond_data = data['by_condition'][condition]
-                    f.write(f"  {condition}: {cond_data['count']}/{cond_data['total']} ({cond_data['percentage']:.1f}%)\n")
-                    f.write(f"    Keyword coverage: {cond_data['keyword_coverage']:.1f}%\n")
-                    if cond_data['matched_keywords']:
-                        f.write(f"    Top matched keywords: {', '.join(cond_data['matched_keywords'][:5])}\n")
-                
-                # Show examples from highest prevalence condition
-                percentages = {cond: data['by_condition'][cond]['percentage'] for cond in ['UEQ', 'UEEQ', 'RAW']}
-                max_condition = max(percentages.keys(), key=lambda x: percentages[x])
-                
-                if data['by_condition'][max_condition]['examples']:
-                    f.write(f"\nEXAMPLES FROM {max_condition} (highest prevalence):\n")
-                    for i, ex in enumerate(data['by_condition'][max_condition]['examples'][:3], 1):
-                        f.write(f"{i}. [P{ex['pattern']}, {ex['decision']}] Keywords: {', '.join(ex['matched_keywords'])}\n")
-                        f.write(f"   {ex['text'][:200]}...\n\n")
-                
-                f.write("=" * 80 + "\n\n")
+            parts.append("=" * 80 + "\n\n")
+        
+        with open(self.output_dir / "COMPREHENSIVE_HYPOTHESIS_ANALYSIS.txt", 'w') as f:
+            f.write(''.join(parts))
         
         print("✓ Comprehensive analysis saved")
     
@@ -490,24 +642,15 @@ class ImprovedHypothesisDrivenAnalyzer:
         prevalence_matrix = np.array(prevalence_data)
         pattern_labels = [name.replace('_', '\\n') for name in results.keys()]
         
-        im = axes[0, 1].imshow(prevalence_matrix, cmap='Blues', aspect='auto')
-        axes[0, 1].set_xticks([0, 1, 2])
-        axes[0, 1].set_xticklabels(['UEQ', 'UEEQ', 'RAW'])
-        axes[0, 1].set_yticks(range(len(pattern_labels)))
-        axes[0, 1].set_yticklabels(pattern_labels, fontsize=9)
+        # Cell annotations and colorbar are drawn by seaborn
+        sns.heatmap(prevalence_matrix, ax=axes[0, 1], annot=True, fmt='.1f', cmap='Blues', cbar=True,
+                    xticklabels=['UEQ', 'UEEQ', 'RAW'], yticklabels=pattern_labels)
+        axes[0, 1].tick_params(axis='y', labelsize=9, labelrotation=0)
         axes[0, 1].set_title('Pattern Prevalence by Condition (%)')
         
-        # Add text annotations
-        for i in range(len(pattern_labels)):
-            for j in range(3):
-                text = axes[0, 1].text(j, i, f'{prevalence_matrix[i, j]:.1f}', 
-                                     ha="center", va="center", color="black" if prevalence_matrix[i, j] < 15 else "white")
-        
-        plt.colorbar(im, ax=axes[0, 1])
-        
         # 3. Statistical significance scatter
         scatter = axes[1, 0].scatter(effect_sizes, [-np.log10(p) for p in p_values], 
-                                   c=colors, alpha=0.7, s=100)
+                                   c=colors, alpha=0.7, s=100, rasterized=True)
         axes[1, 0].axhline(y=-np.log10(0.05), color='red', linestyle='--', alpha=0.5, label='p = 0.05')
         axes[1, 0].axhline(y=-np.log10(0.01), color='darkred', linestyle='--', alpha=0.5, label='p = 0.01')
         axes[1, 0].set_xlabel('Effect Size (Cramér\'s V)')
@@ -534,8 +677,9 @@ class ImprovedHypothesisDrivenAnalyzer:
         axes[1, 1].set_xlabel('Average Keyword Coverage (%)')
         axes[1, 1].set_title('Pattern Recognition Quality\\n(Higher = Better Keyword Match)')
         
+        # Laid out by tight_layout, so the figure is rendered once at its own size
         plt.tight_layout()
-        plt.savefig(self.output_dir / "comprehensive_hypothesis_analysis.png", dpi=300, bbox_inches='tight')
+        plt.savefig(self.output_dir / "comprehensive_hypothesis_analysis.png", dpi=150)
         plt.close()
         
         print("✓ Comprehensive visualizations created")
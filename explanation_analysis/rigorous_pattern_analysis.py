@@ -18,15 +18,84 @@ Methodology:
 
 import pandas as pd
 import numpy as np
+import functools
+import hashlib
 import json
+import pickle
+import re
 from pathlib import Path
-from scipy import stats
+from scipy import sparse
 import matplotlib.pyplot as plt
 import seaborn as sns
 from collections import defaultdict, Counter
+from contingency import chi_square_tests
+from data_loader import load_explanations, PARQUET_AVAILABLE
 import warnings
 warnings.filterwarnings('ignore')
 
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Inputs of the cached pipeline steps, relative to the data directory
+SOURCE_FILES = (
+    'all_explanations_raw.csv',
+    'scientific_analysis/lda_topics.json',
+    'word_frequency_UEQ.csv',
+    'word_frequency_UEEQ.csv',
+    'word_frequency_RAW.csv',
+    'word_frequency_overall.csv',
+    'scientific_analysis/explanations_with_topics.csv',
+)
+
+def cached_step(*attributes, inputs=()):
+    """Cache a pipeline step's return value and the attributes it sets.
+    
+    The cache lives in the analyzer's output directory under ``_cache`` and is
+    keyed by the step, its arguments, the analyzer attributes named in
+    ``inputs`` and the modification times of this script and the source files,
+    so changing any of them reruns the step and replaces its cached result.
+    Cached steps only compute; files are written by their callers, which run
+    every time.
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            sources = [Path(__file__)] + [self.data_dir / name for name in SOURCE_FILES]
+            fingerprint = [(str(path), path.stat().st_mtime_ns) for path in sources if path.exists()]
+            key = hashlib.blake2b(repr((method.__name__, args, sorted(kwargs.items()), fingerprint)).encode())
+            key.update(pickle.dumps([getattr(self, name, None) for name in inputs]))
+            cache_dir = self.output_dir / "_cache"
+            cache_file = cache_dir / f"{method.__name__}_{key.hexdigest()[:16]}.pkl"
+            
+            if cache_file.exists():
+                with open(cache_file, 'rb') as f:
+                    result, state = pickle.load(f)
+                for name, value in state.items():
+                    setattr(self, name, value)
+                print(f"  ✓ Loaded {method.__name__} results from cache")
+                return result
+            
+            result = method(self, *args, **kwargs)
+            cache_dir.mkdir(exist_ok=True)
+            
+            # Only the latest result of each step is kept
+            for stale_file in cache_dir.glob(f"{method.__name__}_{'?' * 16}.pkl"):
+                stale_file.unlink()
+            with open(cache_file, 'wb') as f:
+                pickle.dump((result, {name: getattr(self, name, None) for name in attributes}), f)
+            return result
+        return wrapper
+    return decorator
+
 class RigorousPatternAnalyzer:
     def __init__(self, data_dir="explanation_analysis_output"):
         self.data_dir = Path(data_dir)
@@ -37,19 +106,23 @@ class RigorousPatternAnalyzer:
         self.explanations_df = None
         self.lda_topics = None
         self.word_frequencies = {}
+        self.word_frequency_table = None
         self.patterns = {}
         
         print("Rigorous Pattern Analyzer initialized")
         print(f"Output directory: {self.output_dir}")
     
+    @cached_step('explanations_df', 'lda_topics', 'word_frequencies', 'word_frequency_table', 'topic_assignments')
     def load_all_previous_analyses(self):
         """Load all previously computed analyses."""
         print("Loading previous analyses...")
         
-        # 1. Load main explanations dataset
-        csv_file = self.data_dir / "all_explanations_raw.csv"
-        self.explanations_df = pd.read_csv(csv_file)
-        self.explanations_df['pattern'] = self.explanations_df['pattern'].astype(int)
+        # 1. Load main explanations dataset through the shared loader, which also
+        # lowercases every explanation once; only the columns the analysis uses
+        # are kept, with the labels as categoricals
+        explanations = load_explanations(self.data_dir)
+        self.explanations_df = explanations[['explanation', 'condition', 'release_decision', 'pattern', '_exp_lower']].rename(
+            columns={'_exp_lower': '_explanation_lower'}).astype({'pattern': 'int32'})
         print(f"  ✓ Loaded {len(self.explanations_df)} explanations")
         
         # 2. Load LDA topics
@@ -66,21 +139,46 @@ class RigorousPatternAnalyzer:
             'overall': 'word_frequency_overall.csv'
         }
         
+        freq_frames = []
         for condition, filename in freq_files.items():
             freq_file = self.data_dir / filename
             if freq_file.exists():
-                freq_df = pd.read_csv(freq_file)
+                freq_df = self._read_csv(freq_file)
                 self.word_frequencies[condition] = dict(zip(freq_df['word'], freq_df['frequency']))
+                freq_frames.append(freq_df.assign(condition=condition))
                 print(f"  ✓ Loaded {len(freq_df)} words for {condition}")
         
+        # All frequencies in one long (word, frequency, condition) table
+        if freq_frames:
+            self.word_frequency_table = pd.concat(freq_frames, ignore_index=True)
+        else:
+            self.word_frequency_table = pd.DataFrame(columns=['word', 'frequency', 'condition'])
+        
         # 4. Load topic assignments
         topics_with_docs = self.data_dir / "scientific_analysis" / "explanations_with_topics.csv"
         if topics_with_docs.exists():
-            self.topic_assignments = pd.read_csv(topics_with_docs)
+            self.topic_assignments = self._read_csv(topics_with_docs)
             print(f"  ✓ Loaded topic assignments for {len(self.topic_assignments)} explanations")
         
         return True
     
+    def _read_csv(self, csv_file):
+        """Read a CSV file, through a Parquet copy when pyarrow is installed.
+        
+        The Parquet copy is kept in the output directory's ``_cache`` and written on
+        the first read; it is reused for as long as it is not older than the CSV.
+        """
+        cache_dir = self.output_dir / "_cache"
+        parquet_file = cache_dir / f"{csv_file.stem}.parquet"
+        if PARQUET_AVAILABLE and parquet_file.exists() and parquet_file.stat().st_mtime >= csv_file.stat().st_mtime:
+            return pd.read_parquet(parquet_file, engine='pyarrow')
+        
+        df = pd.read_csv(csv_file)
+        if PARQUET_AVAILABLE:
+            cache_dir.mkdir(exist_ok=True)
+            df.to_parquet(parquet_file, engine='pyarrow', index=False)
+        return df
+    
     def extract_discriminating_keywords(self, min_frequency=5, top_n_per_condition=50):
         """
         Extract keywords that discriminate between conditions using statistical methods.
@@ -92,102 +190,87 @@ class RigorousPatternAnalyzer:
         """
         print("Extracting discriminating keywords...")
         
-        # Get all unique words across conditions
-        all_words = set()
-        for condition_words in self.word_frequencies.values():
-            if isinstance(condition_words, dict):
-                all_words.update(condition_words.keys())
-        
-        # Filter words by minimum frequency
-        valid_words = []
-        for word in all_words:
-            total_freq = sum([self.word_frequencies.get(cond, {}).get(word, 0) 
-                            for cond in ['UEQ', 'UEEQ', 'RAW']])
-            if total_freq >= min_frequency:
-                valid_words.append(word)
-        
-        print(f"  ✓ Analyzing {len(valid_words)} words with frequency >= {min_frequency}")
-        
-        # Calculate discrimination scores for each word
-        discrimination_results = []
-        
-        for word in valid_words:
-            # Get frequencies for each condition
-            ueq_freq = self.word_frequencies.get('UEQ', {}).get(word, 0)
-            ueeq_freq = self.word_frequencies.get('UEEQ', {}).get(word, 0)
-            raw_freq = self.word_frequencies.get('RAW', {}).get(word, 0)
-            
-            total_freq = ueq_freq + ueeq_freq + raw_freq
-            
-            if total_freq == 0:
-                continue
-            
-            # Calculate expected frequencies (assuming equal distribution)
-            ueq_total = sum(self.word_frequencies.get('UEQ', {}).values())
-            ueeq_total = sum(self.word_frequencies.get('UEEQ', {}).values())
-            raw_total = sum(self.word_frequencies.get('RAW', {}).values())
-            grand_total = ueq_total + ueeq_total + raw_total
-            
-            if grand_total == 0:
-                continue
-            
-            expected_ueq = total_freq * (ueq_total / grand_total)
-            expected_ueeq = total_freq * (ueeq_total / grand_total)
-            expected_raw = total_freq * (raw_total / grand_total)
-            
-            # Chi-square test for independence
-            observed = np.array([ueq_freq, ueeq_freq, raw_freq])
-            expected = np.array([expected_ueq, expected_ueeq, expected_raw])
-            
-            # Avoid division by zero
-            expected = np.where(expected == 0, 0.01, expected)
-            
-            chi2 = np.sum((observed - expected) ** 2 / expected)
-            
-            # Calculate relative frequencies for interpretation
-            ueq_pct = ueq_freq / ueq_total if ueq_total > 0 else 0
-            ueeq_pct = ueeq_freq / ueeq_total if ueeq_total > 0 else 0
-            raw_pct = raw_freq / raw_total if raw_total > 0 else 0
-            
-            # Determine which condition this word most characterizes
-            max_pct = max(ueq_pct, ueeq_pct, raw_pct)
-            characteristic_condition = 'UEQ' if ueq_pct == max_pct else ('UEEQ' if ueeq_pct == max_pct else 'RAW')
-            
-            discrimination_results.append({
-                'word': word,
-                'chi2': chi2,
-                'total_frequency': total_freq,
-                'ueq_freq': ueq_freq,
-                'ueeq_freq': ueeq_freq,
-                'raw_freq': raw_freq,
-                'ueq_pct': ueq_pct * 1000,  # per 1000 words for readability
-                'ueeq_pct': ueeq_pct * 1000,
-                'raw_pct': raw_pct * 1000,
-                'characteristic_condition': characteristic_condition,
-                'discrimination_score': max_pct / (sum([ueq_pct, ueeq_pct, raw_pct]) / 3) if sum([ueq_pct, ueeq_pct, raw_pct]) > 0 else 0
-            })
-        
-        # Sort by discrimination score
-        discrimination_results.sort(key=lambda x: x['discrimination_score'], reverse=True)
+        discrimination_df = self._discrimination_table(min_frequency)
         
         # Save detailed results
-        discrimination_df = pd.DataFrame(discrimination_results)
         discrimination_df.to_csv(self.output_dir / "discriminating_keywords_analysis.csv", index=False)
+        if PARQUET_AVAILABLE:
+            discrimination_df.to_parquet(self.output_dir / "discriminating_keywords_analysis.parquet",
+                                         engine='pyarrow', index=False)
         
         # Extract top discriminating words per condition
-        self.discriminating_keywords = {
-            'UEQ': [],
-            'UEEQ': [],
-            'RAW': []
-        }
-        
+        self.discriminating_keywords = {}
         for condition in ['UEQ', 'UEEQ', 'RAW']:
-            condition_words = [r for r in discrimination_results 
-                             if r['characteristic_condition'] == condition][:top_n_per_condition]
-            self.discriminating_keywords[condition] = [w['word'] for w in condition_words]
+            condition_words = discrimination_df.loc[discrimination_df['characteristic_condition'] == condition, 'word']
+            self.discriminating_keywords[condition] = condition_words.head(top_n_per_condition).tolist()
         
         print(f"  ✓ Extracted top {top_n_per_condition} discriminating keywords per condition")
-        return discrimination_results
+        return discrimination_df
+    
+    @cached_step(inputs=('word_frequency_table',))
+    def _discrimination_table(self, min_frequency):
+        """Chi-square and discrimination statistics of every frequent word, by descending score."""
+        conditions = ['UEQ', 'UEEQ', 'RAW']
+        
+        # Observed frequencies: one row per word (sorted), one column per condition
+        freq_table = self.word_frequency_table
+        freq_table = freq_table[freq_table['condition'].isin(conditions)].pivot_table(
+            index='word', columns='condition', values='frequency', aggfunc='sum', fill_value=0
+        ).reindex(columns=conditions, fill_value=0)
+        all_words = freq_table.index.tolist()
+        observed = freq_table.to_numpy(dtype=np.int64)
+        total_freq = observed.sum(axis=1)
+        
+        # Filter words by minimum frequency
+        valid = total_freq >= min_frequency
+        print(f"  ✓ Analyzing {int(valid.sum())} words with frequency >= {min_frequency}")
+        
+        # Word totals per condition; without any words there is nothing to discriminate
+        condition_totals = observed.sum(axis=0)
+        grand_total = condition_totals.sum()
+        valid &= total_freq > 0
+        if grand_total == 0:
+            valid[:] = False
+        
+        words = [word for word, keep in zip(all_words, valid) if keep]
+        observed = observed[valid]
+        total_freq = total_freq[valid]
+        
+        # Chi-square of every word at once: expected frequencies follow each
+        # condition's share of all words (avoiding division by zero)
+        expected = np.outer(total_freq, condition_totals / grand_total)
+        expected = np.where(expected == 0, 0.01, expected)
+        chi2 = ((observed - expected) ** 2 / expected).sum(axis=1)
+        
+        # Relative frequencies for interpretation
+        pct = np.divide(observed, condition_totals, out=np.zeros(observed.shape), where=condition_totals > 0)
+        
+        # Condition each word most characterizes (argmax takes the first one on ties)
+        # and how strongly
+        characteristic = pct.argmax(axis=1)
+        max_pct = np.take_along_axis(pct, characteristic[:, None], axis=1)[:, 0]
+        mean_pct = pct.sum(axis=1) / 3
+        discrimination_score = np.divide(max_pct, mean_pct, out=np.zeros(len(words)), where=mean_pct > 0)
+        
+        # Sort by discrimination score, keeping the word order on ties; the columns
+        # are reordered before the DataFrame is built from them in one call
+        order = np.argsort(-discrimination_score, kind='stable')
+        observed, pct = observed[order], pct[order]
+        
+        discrimination_df = pd.DataFrame({
+            'word': np.array(words, dtype=object)[order],
+            'chi2': chi2[order],
+            'total_frequency': total_freq[order],
+            'ueq_freq': observed[:, 0],
+            'ueeq_freq': observed[:, 1],
+            'raw_freq': observed[:, 2],
+            'ueq_pct': pct[:, 0] * 1000,  # per 1000 words for readability
+            'ueeq_pct': pct[:, 1] * 1000,
+            'raw_pct': pct[:, 2] * 1000,
+            'characteristic_condition': np.array(conditions)[characteristic[order]],
+            'discrimination_score': discrimination_score[order]
+        })
+        return discrimination_df
     
     def combine_topic_and_keyword_patterns(self):
         """
@@ -200,6 +283,18 @@ class RigorousPatternAnalyzer:
         """
         print("Combining topic and keyword analyses...")
         
+        self._build_combined_patterns()
+        
+        # Save combined patterns
+        with open(self.output_dir / "combined_patterns_methodology.json", 'w') as f:
+            json.dump(self.combined_patterns, f, indent=2)
+        
+        print(f"  ✓ Created {len(self.combined_patterns)} combined patterns")
+        return self.combined_patterns
+    
+    @cached_step('combined_patterns', 'pattern_keywords', 'pattern_keywords_lower', inputs=('discriminating_keywords',))
+    def _build_combined_patterns(self):
+        """Build the combined patterns and their comprehensive keyword lists."""
         # Start with LDA topic interpretations as base patterns
         base_patterns = {
             0: {
@@ -253,6 +348,8 @@ class RigorousPatternAnalyzer:
         }
         
         # Enhance patterns with discriminating keywords
+        self.pattern_keywords = {}
+        self.pattern_keywords_lower = {}
         for pattern_id, pattern in base_patterns.items():
             condition_keywords = {
                 'UEQ': [],
@@ -260,28 +357,35 @@ class RigorousPatternAnalyzer:
                 'RAW': []
             }
             
+            # Simple semantic matching (could be enhanced with word embeddings): a keyword
+            # relates to the topic when it contains a topic word or a topic word contains it.
+            # Topic words are searched as one regex alternation, and keywords inside the
+            # newline-joined topic words
+            topic_word_regex = re.compile('|'.join(map(re.escape, pattern['lda_words'])))
+            topic_text = '\n'.join(pattern['lda_words'])
+            
             # Find discriminating keywords related to this topic
             for condition in ['UEQ', 'UEEQ', 'RAW']:
                 # Look for semantic overlap between topic words and discriminating keywords
                 topic_related_keywords = []
                 for keyword in self.discriminating_keywords[condition]:
-                    # Simple semantic matching (could be enhanced with word embeddings)
-                    if any(topic_word in keyword or keyword in topic_word 
-                          for topic_word in pattern['lda_words']):
+                    if topic_word_regex.search(keyword) or keyword in topic_text:
                         topic_related_keywords.append(keyword)
+                        if len(topic_related_keywords) == 10:  # Top 10 per condition
+                            break
                 
-                condition_keywords[condition] = topic_related_keywords[:10]  # Top 10 per condition
+                condition_keywords[condition] = topic_related_keywords
             
             pattern['discriminating_keywords'] = condition_keywords
+            
+            # Comprehensive keyword list for validation, lowercased once for matching
+            all_keywords = set(pattern['lda_words'])
+            for keywords in condition_keywords.values():
+                all_keywords.update(keywords)
+            self.pattern_keywords[pattern_id] = list(all_keywords)
+            self.pattern_keywords_lower[pattern_id] = [keyword.lower() for keyword in all_keywords]
         
         self.combined_patterns = base_patterns
-        
-        # Save combined patterns
-        with open(self.output_dir / "combined_patterns_methodology.json", 'w') as f:
-            json.dump(self.combined_patterns, f, indent=2)
-        
-        print(f"  ✓ Created {len(self.combined_patterns)} combined patterns")
-        return self.combined_patterns
     
     def validate_patterns_statistically(self):
         """
@@ -296,43 +400,47 @@ class RigorousPatternAnalyzer:
         print("Validating patterns statistically...")
         
         validation_results = {}
-        
-        for pattern_id, pattern in self.combined_patterns.items():
+        conditions = ['UEQ', 'UEEQ', 'RAW']
+        decisions = ['Yes', 'No']
+        
+        # Binary classification for each explanation and pattern: does it contain any pattern keyword?
+        pattern_matches = self._pattern_match_matrix()
+        
+        # Matches of every pattern by condition and by release decision (groups x patterns)
+        condition_matches, condition_totals = self._count_matches_by_group(
+            self.explanations_df['condition'], conditions, pattern_matches)
+        release_matches, release_totals = self._count_matches_by_group(
+            self.explanations_df['release_decision'], decisions, pattern_matches)
+        
+        # Chi-square tests for condition independence on the matches and non-matches
+        # tables of all patterns (patterns x 2 x conditions). Tables with an empty row
+        # or column have no expected frequencies and are not tested; tables with a
+        # cell below 5 are tested but flagged
+        contingency_tables = np.stack([condition_matches.T, (condition_totals[:, None] - condition_matches).T], axis=1)
+        chi2_values, p_values, cramers_vs = chi_square_tests(contingency_tables)
+        testable = (contingency_tables.sum(axis=2) > 0).all(axis=1) & (contingency_tables.sum(axis=1) > 0).all(axis=1)
+        low_counts = contingency_tables.min(axis=(1, 2)) < 5
+        chi2_values = np.where(testable, chi2_values, 0)
+        p_values = np.where(testable, p_values, 1.0)
+        cramers_vs = np.where(testable, cramers_vs, 0)
+        
+        # Bonferroni correction for multiple testing
+        bonferroni_threshold = 0.05 / len(p_values)
+        bonferroni_significant = p_values < bonferroni_threshold
+        
+        for column, (pattern_id, pattern) in enumerate(self.combined_patterns.items()):
             pattern_name = pattern['name']
             
-            # Create comprehensive keyword list
-            all_keywords = set(pattern['lda_words'])
-            for condition_keywords in pattern['discriminating_keywords'].values():
-                all_keywords.update(condition_keywords)
-            
-            pattern_keywords = list(all_keywords)
+            pattern_keywords = self.pattern_keywords[pattern_id]
             
             print(f"  Analyzing pattern: {pattern_name} ({len(pattern_keywords)} keywords)")
             
-            # Binary classification for each explanation
-            pattern_matches = []
-            for _, row in self.explanations_df.iterrows():
-                explanation = str(row['explanation']).lower()
-                
-                # Check if any pattern keywords appear in explanation
-                has_pattern = any(keyword.lower() in explanation for keyword in pattern_keywords)
-                
-                pattern_matches.append({
-                    'condition': row['condition'],
-                    'release_decision': row['release_decision'],
-                    'pattern': row['pattern'],
-                    'has_pattern': has_pattern,
-                    'explanation_id': row.name
-                })
-            
-            pattern_df = pd.DataFrame(pattern_matches)
+            has_pattern = pattern_matches[:, column]
+            chi2, p_value, cramers_v = chi2_values[column], p_values[column], cramers_vs[column]
             
             # Statistical analysis by condition
             condition_analysis = {}
-            for condition in ['UEQ', 'UEEQ', 'RAW']:
-                condition_data = pattern_df[pattern_df['condition'] == condition]
-                matches = condition_data['has_pattern'].sum()
-                total = len(condition_data)
+            for condition, matches, total in zip(conditions, condition_matches[:, column], condition_totals):
                 percentage = (matches / total) * 100 if total > 0 else 0
                 
                 condition_analysis[condition] = {
@@ -341,30 +449,9 @@ class RigorousPatternAnalyzer:
                     'percentage': percentage
                 }
             
-            # Chi-square test for condition independence
-            contingency_table = []
-            for condition in ['UEQ', 'UEEQ', 'RAW']:
-                matches = condition_analysis[condition]['matches']
-                non_matches = condition_analysis[condition]['total'] - matches
-                contingency_table.append([matches, non_matches])
-            
-            contingency_array = np.array(contingency_table).T
-            
-            if contingency_array.sum() > 0 and contingency_array.min() >= 5:
-                chi2, p_value, dof, expected = stats.chi2_contingency(contingency_array)
-                
-                # Effect size (Cramér's V)
-                n = contingency_array.sum()
-                cramers_v = np.sqrt(chi2 / (n * (min(contingency_array.shape) - 1)))
-            else:
-                chi2, p_value, cramers_v = 0, 1.0, 0
-            
             # Analysis by release decision
             release_analysis = {}
-            for decision in ['Yes', 'No']:
-                decision_data = pattern_df[pattern_df['release_decision'] == decision]
-                matches = decision_data['has_pattern'].sum()
-                total = len(decision_data)
+            for decision, matches, total in zip(decisions, release_matches[:, column], release_totals):
                 percentage = (matches / total) * 100 if total > 0 else 0
                 
                 release_analysis[decision] = {
@@ -378,9 +465,9 @@ class RigorousPatternAnalyzer:
                 'description': pattern['description'],
                 'keywords': pattern_keywords,
                 'keyword_count': len(pattern_keywords),
-                'total_matches': int(pattern_df['has_pattern'].sum()),
-                'total_explanations': len(pattern_df),
-                'overall_percentage': (pattern_df['has_pattern'].sum() / len(pattern_df)) * 100,
+                'total_matches': int(has_pattern.sum()),
+                'total_explanations': len(has_pattern),
+                'overall_percentage': (has_pattern.sum() / len(has_pattern)) * 100,
                 'by_condition': condition_analysis,
                 'by_release': release_analysis,
                 'statistical_test': {
@@ -388,18 +475,12 @@ class RigorousPatternAnalyzer:
                     'p_value': float(p_value),
                     'cramers_v': float(cramers_v),
                     'significant_05': bool(p_value < 0.05),
-                    'significant_01': bool(p_value < 0.01)
+                    'significant_01': bool(p_value < 0.01),
+                    'low_count_warning': bool(low_counts[column]),
+                    'bonferroni_significant': bool(bonferroni_significant[column])
                 }
             }
         
-        # Apply Bonferroni correction for multiple testing
-        p_values = [result['statistical_test']['p_value'] for result in validation_results.values()]
-        n_tests = len(p_values)
-        bonferroni_threshold = 0.05 / n_tests
-        
-        for pattern_name, result in validation_results.items():
-            result['statistical_test']['bonferroni_significant'] = bool(result['statistical_test']['p_value'] < bonferroni_threshold)
-        
         self.validation_results = validation_results
         
         # Save validation results
@@ -411,6 +492,78 @@ class RigorousPatternAnalyzer:
         
         return validation_results
     
+    def _count_matches_by_group(self, labels, groups, pattern_matches):
+        """Count pattern matches and explanations per group label.
+        
+        Returns a (groups x patterns) array of matches and the number of
+        explanations in each group; labels outside the groups are not counted.
+        """
+        grouped = pd.DataFrame(pattern_matches).groupby(pd.Categorical(labels, categories=groups), observed=False)
+        return grouped.sum().to_numpy(), grouped.size().to_numpy()
+    
+    def _pattern_match_matrix(self):
+        """Mark which combined patterns each explanation matches.
+        
+        Returns an (explanations x patterns) boolean matrix; an explanation matches
+        a pattern when it contains any of the pattern's keywords as a substring.
+        The explanations are scanned once for the keywords of all patterns, and
+        pattern membership follows from multiplying the sparse keyword occurrences
+        by a (keywords x patterns) membership mask.
+        """
+        pattern_ids = list(self.combined_patterns)
+        vocabulary = sorted(set().union(*(self.pattern_keywords_lower[pattern_id] for pattern_id in pattern_ids)))
+        
+        membership = np.zeros((len(vocabulary), len(pattern_ids)), dtype=np.int32)
+        for column, pattern_id in enumerate(pattern_ids):
+            membership[:, column] = np.isin(vocabulary, self.pattern_keywords_lower[pattern_id])
+        
+        occurrences = self._keyword_occurrences(vocabulary)
+        return np.asarray(occurrences @ membership) > 0
+    
+    def _keyword_occurrences(self, vocabulary):
+        """Mark which vocabulary keywords each explanation contains.
+        
+        Returns a sparse (explanations x keywords) CSR matrix of ones. With
+        hyperscan installed, one compiled database scans all explanations in a
+        single buffer; else with pyahocorasick, one automaton scans each
+        explanation once; otherwise each keyword is searched as a plain substring.
+        """
+        lowered = self.explanations_df['_explanation_lower']
+        
+        if HYPERSCAN_AVAILABLE:
+            # All explanations in one UTF-8 buffer, separated by NUL bytes no keyword
+            # contains, with the offset at which each row starts
+            encoded = [explanation.encode() for explanation in lowered]
+            row_starts = np.cumsum([0] + [len(data) + 1 for data in encoded[:-1]])
+            keyword_lengths = [len(keyword.encode()) for keyword in vocabulary]
+            
+            database = hyperscan.Database()
+            database.compile(expressions=[re.escape(keyword).encode() for keyword in vocabulary],
+                             ids=list(range(len(vocabulary))),
+                             elements=len(vocabulary))
+            hits = []
+            database.scan(b'\0'.join(encoded),
+                          match_event_handler=lambda i, _start, end, _flags, _context:
+                          hits.append((end - keyword_lengths[i], i)))
+            
+            starts, columns = np.array(hits, dtype=np.int64).reshape(-1, 2).T
+            rows = np.searchsorted(row_starts, starts, side='right') - 1
+            rows, columns = np.unique(np.column_stack([rows, columns]), axis=0).reshape(-1, 2).T
+        elif AHOCORASICK_AVAILABLE:
+            automaton = ahocorasick.Automaton()
+            for i, keyword in enumerate(vocabulary):
+                automaton.add_word(keyword, i)
+            automaton.make_automaton()
+            
+            pairs = {(row, i) for row, explanation in enumerate(lowered) for _, i in automaton.iter(explanation)}
+            rows, columns = np.array(sorted(pairs), dtype=np.int64).reshape(-1, 2).T
+        else:
+            hits = np.column_stack([lowered.str.contains(keyword, regex=False).to_numpy() for keyword in vocabulary])
+            rows, columns = np.nonzero(hits)
+        
+        return sparse.csr_matrix((np.ones(len(rows), dtype=np.int32), (rows, columns)),
+                                 shape=(len(lowered), len(vocabulary)))
+    
     def create_rigorous_analysis_report(self):
         """Create a comprehensive, methodologically rigorous report."""
         with open(self.output_dir / "RIGOROUS_ANALYSIS_REPORT.txt", 'w') as f:
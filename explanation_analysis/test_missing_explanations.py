@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Regression check: a literal "None" answer in all_explanations_raw.csv is read
+back as NaN and must not stop the analyses that use the shared loader.
+"""
+
+import shutil
+from pathlib import Path
+
+import pandas as pd
+
+from data_loader import load_explanations
+from rigorous_pattern_analysis import RigorousPatternAnalyzer
+
+OUTPUT_DIR = Path(__file__).resolve().parent.parent / "explanation_analysis_output"
+INPUT_FILES = [
+    'all_explanations_raw.csv',
+    'scientific_analysis/lda_topics.json',
+    'scientific_analysis/explanations_with_topics.csv',
+    'word_frequency_UEQ.csv',
+    'word_frequency_UEEQ.csv',
+    'word_frequency_RAW.csv',
+    'word_frequency_overall.csv',
+]
+
+
+def make_data_dir(tmp_path):
+    """Copy the analysis inputs and append an explanation that reads back as NaN."""
+    for name in INPUT_FILES:
+        (tmp_path / name).parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy(OUTPUT_DIR / name, tmp_path / name)
+    with open(tmp_path / 'all_explanations_raw.csv', 'a', encoding='utf-8') as f:
+        f.write("R_missing,UEQ,1,No,None\n")
+    return tmp_path
+
+
+def test_loader_drops_missing_explanations(tmp_path):
+    data_dir = make_data_dir(tmp_path)
+    raw = pd.read_csv(data_dir / 'all_explanations_raw.csv')
+    assert raw['explanation'].isna().any()
+    
+    df = load_explanations(data_dir)
+    assert len(df) == raw['explanation'].notna().sum()
+    assert df['_exp_lower'].map(type).eq(str).all()
+    assert df['tokens'].map(type).eq(list).all()
+
+
+def test_rigorous_analysis_completes(tmp_path):
+    analyzer = RigorousPatternAnalyzer(make_data_dir(tmp_path))
+    analyzer.load_all_previous_analyses()
+    analyzer.extract_discriminating_keywords()
+    analyzer.combine_topic_and_keyword_patterns()
+    analyzer.validate_patterns_statistically()
+    analyzer.create_rigorous_analysis_report()
+    
+    assert (analyzer.output_dir / "pattern_validation_results.json").exists()
+    assert (analyzer.output_dir / "RIGOROUS_ANALYSIS_REPORT.txt").exists()